@@ -1,20 +1,35 @@
 """Main application entry point for MLS Photo Processor."""
 import logging
+import logging.handlers
 import sys
+import threading
 from pathlib import Path
 
 from matcher import ParcelMatcher
 from classifier import ImageClassifier
 from processor import process_folder
 from gui import MLSPhotoProcessorGUI
+from file_utils import log_jpeg_codec
 
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Log file writes are buffered and flushed in bulk (every 256 records, on any ERROR,
+# when processing finishes, and at exit via logging.shutdown)
+file_handler = logging.FileHandler('mls_photo_processor.log')
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=256,
+    flushLevel=logging.ERROR,
+    target=file_handler
+)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('mls_photo_processor.log')
+        buffered_file_handler
     ]
 )
 logger = logging.getLogger(__name__)
@@ -23,6 +38,7 @@ logger = logging.getLogger(__name__)
 def main():
     """Main application entry point."""
     logger.info("Starting MLS Photo Processor...")
+    log_jpeg_codec()
     
     try:
         # Initialize components
@@ -30,9 +46,8 @@ def main():
         parcel_matcher = ParcelMatcher()
         logger.info("Parcel matcher loaded successfully")
         
-        logger.info("Loading image classifier...")
+        # CLIP weights are loaded lazily; the GUI warms them up in the background below
         classifier = ImageClassifier()
-        logger.info("Image classifier loaded successfully")
         
         # Create GUI
         logger.info("Initializing GUI...")
@@ -42,6 +57,9 @@ def main():
             classifier=classifier
         )
         
+        # Load CLIP once the window is up, so it overlaps with the user picking a folder
+        app.root.after(0, lambda: threading.Thread(target=classifier.warmup, daemon=True).start())
+        
         logger.info("Starting GUI main loop...")
         app.run()
         
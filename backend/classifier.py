@@ -1,7 +1,16 @@
 """Three-layer image classification: Hard rules → Heuristics → Hugging Face fallback."""
+import hashlib
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 from typing import Optional, List, Tuple, Dict
-from PIL import Image
+from PIL import Image, ImageOps
 import torch
 import numpy as np
 
@@ -16,22 +25,87 @@ except ImportError:
     logger.warning("CLIP not available. Classification will be limited.")
 
 
+def _keyword_mask(queries: List[str], keywords: set) -> int:
+    """
+    Build a detection bitmask for a group of object queries.
+    
+    Args:
+        queries: Ordered object queries; bit i stands for queries[i]
+        keywords: Queries belonging to the group
+        
+    Returns:
+        Integer with the bit of every keyword in the group set
+    """
+    unknown = keywords.difference(queries)
+    if unknown:
+        raise ValueError(f"Rule keywords missing from object queries: {sorted(unknown)}")
+    return sum(1 << i for i, query in enumerate(queries) if query in keywords)
+
+
+class RoomLabel(IntEnum):
+    """Classification labels. Room values are the column indices of ImageClassifier.ROOM_LABELS."""
+    KITCHEN = 0
+    LIVING_ROOM = 1
+    BEDROOM = 2
+    OFFICE = 3
+    DINING_ROOM = 4
+    LAUNDRY_ROOM = 5
+    DECK = 6
+    EXTERIOR = 7
+    BATHROOM = 8
+    OTHER = 9
+
+
+# Final allowed classifications (ALL CAPS ONLY), indexed by RoomLabel
+LABEL_NAMES = (
+    'KITCHEN',
+    'LIVING ROOM',
+    'BEDROOM',
+    'OFFICE',
+    'DINING ROOM',
+    'LAUNDRY ROOM',
+    'DECK',
+    'EXTERIOR',
+    'BATHROOM',
+    'OTHER'
+)
+
+
+@lru_cache(maxsize=None)
+def _load_clip(model_name: str, device: torch.device, dtype: torch.dtype) -> Tuple["CLIPProcessor", "CLIPModel", float]:
+    """
+    Load a CLIP processor and model for inference, once per process.
+    
+    Every ImageClassifier shares the returned objects, so creating another
+    classifier never loads the weights a second time.
+    
+    Args:
+        model_name: Hugging Face model identifier
+        device: Device to place the model on
+        dtype: Weight dtype on that device
+        
+    Returns:
+        Tuple of (processor, model, logit_scale)
+    """
+    processor = CLIPProcessor.from_pretrained(model_name)
+    model = CLIPModel.from_pretrained(model_name)
+    model.eval()
+    # Inference only: freeze the weights so no forward pass can build an autograd graph
+    model.requires_grad_(False)
+    # Read before any cast to half precision so the scale stays exact
+    logit_scale = model.logit_scale.exp().item()
+    model.to(device, dtype=dtype)
+    return processor, model, logit_scale
+
+
 class ImageClassifier:
     """Three-layer image classifier: Hard rules → Heuristics → Hugging Face fallback."""
     
-    # Final allowed classifications (ALL CAPS ONLY)
-    CANONICAL_LABELS = {
-        'KITCHEN',
-        'LIVING ROOM',
-        'BEDROOM',
-        'OFFICE',
-        'DINING ROOM',
-        'LAUNDRY ROOM',
-        'DECK',
-        'EXTERIOR',
-        'BATHROOM',
-        'OTHER'
-    }
+    # Hugging Face model used for object detection and the Layer 3 fallback
+    CLIP_MODEL_NAME = "openai/clip-vit-base-patch32"
+    
+    # Where the encoded text prompts are cached between runs
+    TEXT_CACHE_DIR = Path.home() / ".cache" / "mls_photo_processor"
     
     # Minimum confidence threshold for object detection
     OBJECT_DETECTION_THRESHOLD = 0.6
@@ -39,11 +113,140 @@ class ImageClassifier:
     # Confidence threshold for Hugging Face classifier (Layer 3)
     HF_CLASSIFIER_THRESHOLD = 0.65
     
-    def __init__(self):
-        """Initialize rule-based classifier with CLIP for object detection."""
+    # Thumbnail size used for the outdoor pixel heuristics
+    OUTDOOR_THUMBNAIL_SIZE = (128, 128)
+    
+    # CLIP ViT-B/32 input size and normalization (same values CLIPProcessor uses)
+    CLIP_IMAGE_SIZE = 224
+    CLIP_IMAGE_MEAN = (0.48145466, 0.4578275, 0.40821073)
+    CLIP_IMAGE_STD = (0.26862954, 0.26130258, 0.27577711)
+    
+    # Batches smaller than this fraction of the compiled batch size run on the eager
+    # vision model instead of being padded (e.g. classify_image's single image)
+    COMPILED_MIN_FILL = 0.5
+    
+    # Objects to detect for rule-based classification
+    OBJECT_QUERIES = [
+        # Bathroom
+        'toilet', 'bathtub', 'shower', 'bathroom',
+        # Bedroom
+        'bed', 'mattress', 'bedroom bed',
+        # Kitchen
+        'refrigerator', 'fridge', 'stove', 'oven', 'kitchen sink', 'sink', 'kitchen cabinets', 'cabinet',
+        # Laundry
+        'washing machine', 'dryer', 'washer',
+        'detergent bottle', 'laundry detergent', 'utility sink', 'laundry basket', 'dryer vent', 'lint trap',
+        # Office
+        'desk', 'office desk', 'chair', 'office chair', 'computer', 'laptop',
+        # Living room
+        'couch', 'sofa', 'television', 'tv', 'tv screen', 'fireplace',
+        # Dining room
+        'dining table', 'table', 'dining room table',
+        # Deck/Outdoor
+        'outdoor furniture', 'patio furniture', 'outdoor chair', 'outdoor table', 'railing', 'deck railing',
+        'trees', 'sky', 'siding', 'house siding',
+        # General
+        'outdoor', 'outside', 'indoor', 'inside'
+    ]
+    
+    # Keyword groups for the Layer 1/2 rules as detection bitmasks (bit i = OBJECT_QUERIES[i]),
+    # so each rule check is a single AND instead of a scan over the detections
+    _OUTDOOR_KEYWORDS = _keyword_mask(OBJECT_QUERIES, {'outdoor', 'outside'})
+    _BATHROOM_FIXTURES = _keyword_mask(OBJECT_QUERIES, {'toilet', 'bathtub', 'shower', 'bathroom'})
+    _WASHER = _keyword_mask(OBJECT_QUERIES, {'washing machine', 'washer'})
+    _DRYER = _keyword_mask(OBJECT_QUERIES, {'dryer'})
+    _LAUNDRY_INDICATORS = _keyword_mask(OBJECT_QUERIES, {
+        'detergent bottle', 'laundry detergent',
+        'utility sink',
+        'laundry basket',
+        'dryer vent', 'lint trap'
+    })
+    _BED = _keyword_mask(OBJECT_QUERIES, {'bed', 'mattress', 'bedroom bed'})
+    _DESK = _keyword_mask(OBJECT_QUERIES, {'desk', 'office desk'})
+    _CHAIR = _keyword_mask(OBJECT_QUERIES, {'chair', 'office chair'})
+    _COMPUTER = _keyword_mask(OBJECT_QUERIES, {'computer', 'laptop'})
+    _OUTDOOR_FURNITURE = _keyword_mask(OBJECT_QUERIES, {'outdoor furniture', 'patio furniture', 'outdoor chair', 'outdoor table'})
+    _RAILING = _keyword_mask(OBJECT_QUERIES, {'railing', 'deck railing'})
+    _OUTDOOR_FEATURES = _keyword_mask(OBJECT_QUERIES, {'trees', 'sky', 'siding', 'house siding'})
+    _ANY_FURNITURE = _keyword_mask(OBJECT_QUERIES, {
+        'outdoor furniture', 'patio furniture', 'outdoor chair', 'outdoor table',
+        'chair', 'table', 'couch', 'sofa', 'railing'
+    })
+    _SINK = _keyword_mask(OBJECT_QUERIES, {'kitchen sink', 'sink'})
+    _REFRIGERATOR = _keyword_mask(OBJECT_QUERIES, {'refrigerator', 'fridge'})
+    _STOVE = _keyword_mask(OBJECT_QUERIES, {'stove', 'oven'})
+    _CABINETS = _keyword_mask(OBJECT_QUERIES, {'kitchen cabinets', 'cabinet'})
+    _TABLE = _keyword_mask(OBJECT_QUERIES, {'dining table', 'table', 'dining room table'})
+    _BED_OR_MATTRESS = _keyword_mask(OBJECT_QUERIES, {'bed', 'mattress'})
+    _APPLIANCES = _keyword_mask(OBJECT_QUERIES, {'refrigerator', 'fridge', 'stove', 'oven', 'washing machine', 'dryer'})
+    _COUCH = _keyword_mask(OBJECT_QUERIES, {'couch', 'sofa'})
+    _TV = _keyword_mask(OBJECT_QUERIES, {'television', 'tv', 'tv screen'})
+    _FIREPLACE = _keyword_mask(OBJECT_QUERIES, {'fireplace'})
+    # Bit weight of each query; a (N, Q) detection BoolTensor times these, summed per row,
+    # gives the N detection bitmasks in one reduction (Q <= 63 keeps it exact in int64)
+    _QUERY_BIT_WEIGHTS = torch.tensor([1 << i for i in range(len(OBJECT_QUERIES))], dtype=torch.int64)
+    
+    # Room type labels for zero-shot classification (Layer 3), in RoomLabel order
+    ROOM_LABELS = [
+        'kitchen',
+        'living room',
+        'bedroom',
+        'office',
+        'dining room',
+        'laundry room',
+        'deck',
+        'exterior',
+        'bathroom'
+    ]
+    
+    def __init__(self, batch_size: int = 32):
+        """Initialize rule-based classifier with CLIP for object detection.
+        
+        CLIP is loaded lazily on first use (or by warmup()), so constructing
+        the classifier is cheap and does not delay application startup.
+        
+        Args:
+            batch_size: Number of images sent through CLIP per forward pass
+        """
+        self.batch_size = batch_size
         self.clip_processor = None
         self.clip_model = None
-        self._load_clip_model()
+        self.device = torch.device("cpu")
+        self.dtype = torch.float32
+        # Original vision tower, kept while a torch.compile'd one is in use
+        self._eager_vision_model = None
+        # Batch size the compiled vision tower was traced at; smaller batches are padded to it
+        self._compiled_batch_size = None
+        # Text embeddings for the static query lists, computed once at load time
+        # and pre-multiplied by CLIP's logit scale
+        self._object_text_feats = None
+        self._room_text_feats = None
+        # Guards the one-time lazy CLIP load against concurrent first use
+        self._load_lock = threading.Lock()
+        self._loaded = False
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the one-time CLIP load has finished (successfully or not)."""
+        return self._loaded
+    
+    def warmup(self):
+        """
+        Load CLIP now if it has not been loaded yet.
+        
+        Safe to call from any thread; concurrent callers wait for a single load.
+        Called automatically before the first image is encoded.
+        """
+        if self._loaded:
+            return
+        
+        with self._load_lock:
+            if self._loaded:
+                return
+            start = time.perf_counter()
+            self._load_clip_model()
+            self._loaded = True
+            logger.info(f"CLIP ready after {time.perf_counter() - start:.1f}s")
     
     def _load_clip_model(self):
         """Load CLIP model for object detection only."""
@@ -53,16 +256,280 @@ class ImageClassifier:
         
         try:
             logger.info("Loading CLIP model for object detection...")
-            self.clip_processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
-            self.clip_model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
-            self.clip_model.eval()
+            # Half precision on accelerators; CPUs without native FP16/BF16 kernels are faster in FP32
+            self.device, self.dtype = self._select_device()
+            self.clip_processor, self.clip_model, logit_scale = _load_clip(self.CLIP_MODEL_NAME, self.device, self.dtype)
+            logger.info(f"Running CLIP on {self.device} ({self.dtype})")
+            
+            # The text labels never change, so encode them once instead of per image
+            self._load_text_features()
+            # Fold the logit scale into the text side so scoring is a single matmul
+            self._object_text_feats = self._object_text_feats * logit_scale
+            self._room_text_feats = self._room_text_feats * logit_scale
+            
+            self._compile_vision_model()
             logger.info("CLIP model loaded successfully for object detection")
         except Exception as e:
             logger.error(f"Error loading CLIP model: {e}")
             logger.warning("Object detection will be unavailable. All images will be classified as OTHER.")
             self.clip_processor = None
             self.clip_model = None
+            self._object_text_feats = None
+            self._room_text_feats = None
+            self.device = torch.device("cpu")
+            self.dtype = torch.float32
+            self._eager_vision_model = None
+            self._compiled_batch_size = None
     
+    def _compile_vision_model(self):
+        """
+        Compile the CLIP vision tower with torch.compile on CUDA devices.
+        
+        "reduce-overhead" mode relies on CUDA graphs, so other devices keep the
+        eager model. The graph is compiled for a fixed (batch_size, 3,
+        CLIP_IMAGE_SIZE, CLIP_IMAGE_SIZE) input; _encode_batch pads partial
+        batches up to that shape so they reuse it instead of recompiling, and
+        runs much smaller batches on the eager model.
+        Any failure leaves the eager model in place.
+        """
+        if self.device.type != 'cuda' or not hasattr(torch, "compile"):
+            return
+        
+        eager_vision_model = self.clip_model.vision_model
+        if hasattr(eager_vision_model, "_orig_mod"):
+            # The shared model was already compiled by another classifier instance
+            self._eager_vision_model = eager_vision_model._orig_mod
+            self._compiled_batch_size = getattr(eager_vision_model, "_compiled_batch_size", self.batch_size)
+            return
+        
+        try:
+            compiled_vision_model = torch.compile(eager_vision_model, mode="reduce-overhead", dynamic=False)
+            compiled_vision_model._compiled_batch_size = self.batch_size
+            self.clip_model.vision_model = compiled_vision_model
+            
+            # Compilation is lazy: warm up now at the real batch shape so it happens
+            # at startup and failures surface here
+            dummy = torch.zeros(self.batch_size, 3, self.CLIP_IMAGE_SIZE, self.CLIP_IMAGE_SIZE, device=self.device, dtype=self.dtype)
+            with torch.inference_mode():
+                self.clip_model.get_image_features(pixel_values=dummy)
+            
+            self._eager_vision_model = eager_vision_model
+            self._compiled_batch_size = self.batch_size
+            logger.info("CLIP vision model compiled with torch.compile")
+        except Exception as e:
+            logger.debug(f"torch.compile unavailable, using eager CLIP vision model: {e}")
+            self.clip_model.vision_model = eager_vision_model
+            self._eager_vision_model = None
+            self._compiled_batch_size = None
+    
+    @staticmethod
+    def _select_device() -> Tuple[torch.device, torch.dtype]:
+        """
+        Pick the inference device and matching weight dtype.
+        
+        Returns:
+            Tuple of (device, dtype): FP16 on CUDA/MPS, FP32 on CPU
+        """
+        if torch.cuda.is_available():
+            return torch.device("cuda"), torch.float16
+        if getattr(torch.backends, "mps", None) is not None and torch.backends.mps.is_available():
+            return torch.device("mps"), torch.float16
+        return torch.device("cpu"), torch.float32
+    
+    def _load_text_features(self):
+        """
+        Set the object query and room label embeddings, using the on-disk cache when possible.
+        
+        The cache file is keyed by a hash of the model name, dtype and prompts,
+        so changing any of them re-encodes the text instead of reusing stale features.
+        """
+        key = hashlib.sha256(repr((
+            self.CLIP_MODEL_NAME, str(self.dtype), tuple(self.OBJECT_QUERIES), tuple(self.ROOM_LABELS)
+        )).encode("utf-8")).hexdigest()[:16]
+        cache_path = self.TEXT_CACHE_DIR / f"clip_text_{key}.pt"
+        
+        try:
+            cached = torch.load(cache_path, map_location=self.device, weights_only=True)
+            self._object_text_feats = cached["objects"]
+            self._room_text_feats = cached["rooms"]
+            logger.info(f"Loaded CLIP text embeddings from cache: {cache_path}")
+            return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable CLIP text embedding cache {cache_path}: {e}")
+        
+        self._object_text_feats = self._encode_text(self.OBJECT_QUERIES)
+        self._room_text_feats = self._encode_text(self.ROOM_LABELS)
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so a crash never leaves a truncated cache behind
+            tmp_path = cache_path.with_suffix(".tmp")
+            torch.save({
+                "objects": self._object_text_feats.cpu(),
+                "rooms": self._room_text_feats.cpu()
+            }, tmp_path)
+            os.replace(tmp_path, cache_path)
+            logger.info(f"Saved CLIP text embeddings to cache: {cache_path}")
+        except Exception as e:
+            logger.warning(f"Could not save CLIP text embedding cache: {e}")
+    
+    def _encode_text(self, labels: List[str]) -> torch.Tensor:
+        """
+        Encode text labels with the CLIP text tower.
+        
+        Args:
+            labels: Text prompts to encode
+            
+        Returns:
+            L2-normalized text embeddings, one row per label
+        """
+        text_inputs = self.clip_processor(text=labels, return_tensors="pt", padding=True).to(self.device)
+        with torch.inference_mode():
+            # Similarity scoring is kept in FP32 so thresholds behave the same on every device
+            text_feats = self.clip_model.get_text_features(**text_inputs).float()
+        return text_feats / text_feats.norm(dim=-1, keepdim=True)
+    
+    def _encode_images(self, images: List[Image.Image]) -> Tuple[Optional[torch.Tensor], List[int]]:
+        """
+        Encode a batch of images with the CLIP image tower.
+        
+        Object detection and the Layer 3 fallback both score against these
+        features, so each image goes through the vision model only once.
+        If the batched forward fails (e.g. CUDA out of memory at full batch
+        size, or one bad image), the batch is retried in halves down to single
+        images, so only the images that cannot be encoded lose their features.
+        
+        Args:
+            images: List of RGB PIL Images
+            
+        Returns:
+            Tuple of (L2-normalized image embeddings, indices into images of the
+            rows they belong to). Embeddings are None if CLIP is unavailable or
+            no image could be encoded.
+        """
+        if not images:
+            return None, []
+        
+        self.warmup()
+        if not self.clip_model:
+            return None, []
+        
+        return self._encode_with_fallback(images, list(range(len(images))))
+    
+    def _encode_with_fallback(self, images: List[Image.Image], indices: List[int]) -> Tuple[Optional[torch.Tensor], List[int]]:
+        """
+        Encode images[indices] in one forward, splitting the batch in halves on failure.
+        
+        Args:
+            images: List of RGB PIL Images
+            indices: Positions in images to encode
+            
+        Returns:
+            Tuple of (embeddings or None, the indices that were encoded, in row order)
+        """
+        try:
+            return self._encode_batch([images[i] for i in indices]), indices
+        except Exception as e:
+            if self._eager_vision_model is not None:
+                # The compiled graph can still fail at runtime; fall back to eager mode
+                logger.warning(f"Compiled CLIP vision model failed, reverting to eager mode: {e}")
+                self.clip_model.vision_model = self._eager_vision_model
+                self._eager_vision_model = None
+                self._compiled_batch_size = None
+                return self._encode_with_fallback(images, indices)
+            
+            if len(indices) == 1:
+                logger.error(f"Error encoding image with CLIP: {e}")
+                return None, []
+            
+            logger.warning(f"CLIP encode of {len(indices)} images failed, retrying in halves: {e}")
+            if self.device.type == 'cuda':
+                # Release the failed batch's cached blocks before the smaller retries
+                torch.cuda.empty_cache()
+            
+            mid = len(indices) // 2
+            halves = [self._encode_with_fallback(images, half) for half in (indices[:mid], indices[mid:])]
+            feats = [half_feats for half_feats, _ in halves if half_feats is not None]
+            encoded = [i for _, half_indices in halves for i in half_indices]
+            return (torch.cat(feats) if feats else None), encoded
+    
+    def _encode_batch(self, images: List[Image.Image]) -> torch.Tensor:
+        """
+        Run one CLIP image-tower forward over a batch.
+        
+        Args:
+            images: List of RGB PIL Images
+            
+        Returns:
+            L2-normalized image embeddings, one row per image
+            
+        Raises:
+            Exception: Whatever preprocessing or the forward pass raised
+        """
+        # Cast on the host so only half as many bytes cross the bus on FP16 devices
+        pixel_values = self._preprocess_images(images).to(self.dtype)
+        use_eager = False
+        if self._eager_vision_model is not None and len(images) < self._compiled_batch_size:
+            if len(images) < self._compiled_batch_size * self.COMPILED_MIN_FILL:
+                # Padding would encode mostly zeros; the eager model handles any batch size
+                use_eager = True
+            else:
+                # Pad partial batches to the compiled shape so they reuse the compiled graph
+                padding = pixel_values.new_zeros((self._compiled_batch_size - len(images),) + pixel_values.shape[1:])
+                pixel_values = torch.cat([pixel_values, padding])
+        if self.device.type == 'cuda':
+            # Page-locked memory lets the host-to-device copy run asynchronously
+            pixel_values = pixel_values.pin_memory()
+        pixel_values = pixel_values.to(self.device, non_blocking=True)
+        with torch.inference_mode():
+            if use_eager:
+                # Same computation as get_image_features, but through the uncompiled tower
+                pooled = self._eager_vision_model(pixel_values=pixel_values).pooler_output
+                image_feats = self.clip_model.visual_projection(pooled)
+            else:
+                image_feats = self.clip_model.get_image_features(pixel_values=pixel_values)
+            image_feats = image_feats[:len(images)].float()
+            return image_feats / image_feats.norm(dim=-1, keepdim=True)
+    
+    def _score_against(self, image_feats: torch.Tensor, text_feats: torch.Tensor) -> torch.Tensor:
+        """
+        Score image embeddings against precomputed text embeddings.
+        
+        Equivalent to CLIPModel's logits_per_image followed by a softmax.
+        
+        Args:
+            image_feats: L2-normalized image embeddings from _encode_images
+            text_feats: Text embeddings, L2-normalized and scaled by CLIP's logit scale
+            
+        Returns:
+            Softmax probabilities with shape (len(image_feats), len(text_feats))
+        """
+        with torch.inference_mode():
+            logits_per_image = image_feats @ text_feats.T
+            return logits_per_image.softmax(dim=1)
+    
+    def _preprocess_images(self, images: List[Image.Image]) -> torch.Tensor:
+        """
+        Build CLIP pixel values directly, without going through CLIPProcessor.
+        
+        Resizes the shortest side to CLIP_IMAGE_SIZE, center crops to a square
+        and normalizes with CLIP's mean/std, matching the processor's output.
+        
+        Args:
+            images: List of RGB PIL Images
+            
+        Returns:
+            Float tensor with shape (len(images), 3, CLIP_IMAGE_SIZE, CLIP_IMAGE_SIZE)
+        """
+        size = (self.CLIP_IMAGE_SIZE, self.CLIP_IMAGE_SIZE)
+        batch = np.stack([np.asarray(ImageOps.fit(image, size, Image.BICUBIC), dtype=np.uint8) for image in images])
+        
+        pixel_values = torch.from_numpy(batch).permute(0, 3, 1, 2).float().div_(255)
+        mean = torch.tensor(self.CLIP_IMAGE_MEAN).view(1, 3, 1, 1)
+        std = torch.tensor(self.CLIP_IMAGE_STD).view(1, 3, 1, 1)
+        return (pixel_values - mean) / std
     
     def _load_image_from_path(self, image_path: str) -> Optional[Image.Image]:
         """Load image from local file path.
@@ -74,115 +541,103 @@ class ImageClassifier:
             PIL Image or None if failed
         """
         try:
-            img = Image.open(image_path)
+            # Open the file ourselves so its handle is closed as soon as the pixels are decoded,
+            # not whenever the Image is garbage collected on a prefetch thread
+            with open(image_path, 'rb') as f:
+                img = Image.open(f)
+                if img.format == 'JPEG':
+                    # Let libjpeg decode at a reduced DCT scale (1/2 to 1/8). Asking for twice
+                    # CLIP's input size keeps enough pixels for a clean resize below.
+                    draft_size = 2 * self.CLIP_IMAGE_SIZE
+                    img.draft('RGB', (draft_size, draft_size))
+                # Decode now, on the calling (prefetch) thread, rather than lazily during inference
+                img.load()
+            
             if img.mode != 'RGB':
                 img = img.convert('RGB')
+            
+            # Downstream steps only need CLIP's input resolution, so shrink the shortest
+            # side to CLIP_IMAGE_SIZE here (on the prefetch thread) instead of carrying
+            # full-resolution pixels through the batch
+            scale = self.CLIP_IMAGE_SIZE / min(img.size)
+            if scale < 1:
+                new_size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+                img = img.resize(new_size, Image.BICUBIC)
             return img
         except Exception as e:
             logger.error(f"Error loading image from {image_path}: {e}")
             return None
     
-    def _detect_objects(self, image: Image.Image) -> Dict[str, float]:
+    def _detect_objects_batch(self, image_feats: torch.Tensor) -> Tuple[List[Dict[str, float]], List[int]]:
         """
-        Detect objects in image using CLIP.
-        Returns dictionary of object -> confidence score.
+        Detect objects using CLIP.
+        Returns the detections per image both as a bitmask over OBJECT_QUERIES
+        (bit i set if OBJECT_QUERIES[i] was detected), which the rule layers
+        test against, and as a dictionary of object -> confidence for logging.
         
         Args:
-            image: PIL Image
+            image_feats: Image embeddings from _encode_images
             
         Returns:
-            Dictionary mapping object names to confidence scores
-        """
-        if not self.clip_model or not self.clip_processor:
-            return {}
-        
-        # Objects to detect for rule-based classification
-        object_queries = [
-            # Bathroom
-            'toilet', 'bathtub', 'shower', 'bathroom',
-            # Bedroom
-            'bed', 'mattress', 'bedroom bed',
-            # Kitchen
-            'refrigerator', 'fridge', 'stove', 'oven', 'kitchen sink', 'sink', 'kitchen cabinets', 'cabinet',
-            # Laundry
-            'washing machine', 'dryer', 'washer',
-            'detergent bottle', 'laundry detergent', 'utility sink', 'laundry basket', 'dryer vent', 'lint trap',
-            # Office
-            'desk', 'office desk', 'chair', 'office chair', 'computer', 'laptop',
-            # Living room
-            'couch', 'sofa', 'television', 'tv', 'tv screen', 'fireplace',
-            # Dining room
-            'dining table', 'table', 'dining room table',
-            # Deck/Outdoor
-            'outdoor furniture', 'patio furniture', 'outdoor chair', 'outdoor table', 'railing', 'deck railing',
-            'trees', 'sky', 'siding', 'house siding',
-            # General
-            'outdoor', 'outside', 'indoor', 'inside'
-        ]
-        
+            Tuple of (one detection dictionary per image, one bitmask per image)
+        """
         try:
-            # Process image and text queries
-            inputs = self.clip_processor(
-                text=object_queries,
-                images=image,
-                return_tensors="pt",
-                padding=True
-            )
-            
-            # Run inference
-            with torch.no_grad():
-                outputs = self.clip_model(**inputs)
-            
-            # Get similarity scores
-            logits_per_image = outputs.logits_per_image
-            probs = logits_per_image.softmax(dim=1)
-            
-            # Build detection dictionary
-            detections = {}
-            for i, query in enumerate(object_queries):
-                confidence = float(probs[0][i].item())
-                if confidence >= self.OBJECT_DETECTION_THRESHOLD:
-                    detections[query] = confidence
-            
-            return detections
+            # Score all images against the cached object query embeddings
+            # Copy the (N, Q) matrix to the host once; everything below reads it without device syncs
+            probs = self._score_against(image_feats, self._object_text_feats).cpu()
+            present = probs >= self.OBJECT_DETECTION_THRESHOLD
+            
+            # Fold each row of the (N, Q) detection matrix into an integer bitmask
+            masks = (present.to(torch.int64) * self._QUERY_BIT_WEIGHTS).sum(dim=1).tolist()
+            
+            # Only the (few) detected entries are turned into Python objects
+            batch_detections = [{} for _ in masks]
+            rows, cols = present.nonzero(as_tuple=True)
+            for row, col, confidence in zip(rows.tolist(), cols.tolist(), probs[rows, cols].tolist()):
+                batch_detections[row][self.OBJECT_QUERIES[col]] = confidence
+            
+            return batch_detections, masks
             
         except Exception as e:
             logger.error(f"Error in object detection: {e}")
-            return {}
+            return [{} for _ in range(len(image_feats))], [0] * len(image_feats)
     
-    def _is_outdoor(self, image: Image.Image, detections: Dict[str, float]) -> bool:
+    def _is_outdoor(self, image: Image.Image, detected: int) -> bool:
         """
         Determine if image is outdoor using heuristics and detections.
         
         Args:
             image: PIL Image
-            detections: Dictionary of detected objects
+            detected: Bitmask of detected objects (see _detect_objects_batch)
             
         Returns:
             True if image appears to be outdoor
         """
         # Check detections first
-        outdoor_keywords = ['outdoor', 'outside']
-        if any(keyword in detections for keyword in outdoor_keywords):
+        if detected & self._OUTDOOR_KEYWORDS:
             return True
         
         # Use pixel-based heuristic
         try:
-            img_array = np.array(image)
+            # These are whole-image statistics, so a small thumbnail gives the same
+            # answer as the full-resolution photo with a fraction of the memory traffic
+            thumbnail = image.resize(self.OUTDOOR_THUMBNAIL_SIZE, Image.BILINEAR)
+            img_array = np.asarray(thumbnail, dtype=np.uint8)
             
             # Check for sky (bright blue/white pixels in top portion)
             top_portion = img_array[:img_array.shape[0]//3, :]
             blue_mask = (top_portion[:, :, 2] > 150) & (top_portion[:, :, 1] > 100) & (top_portion[:, :, 0] < 150)
-            sky_ratio = np.sum(blue_mask) / (top_portion.shape[0] * top_portion.shape[1])
+            sky_ratio = blue_mask.mean()
             
             # Check for green (grass) in bottom portion
             bottom_portion = img_array[2*img_array.shape[0]//3:, :]
             green_mask = (bottom_portion[:, :, 1] > bottom_portion[:, :, 0]) & (bottom_portion[:, :, 1] > bottom_portion[:, :, 2])
-            grass_ratio = np.sum(green_mask) / (bottom_portion.shape[0] * bottom_portion.shape[1])
+            grass_ratio = green_mask.mean()
             
             # High brightness variance suggests outdoor lighting
-            gray = np.mean(img_array, axis=2)
-            brightness_variance = np.var(gray)
+            # Sum channels in integer space; var(sum / 3) == var(sum) / 9
+            gray_sum = img_array.sum(axis=2, dtype=np.uint16)
+            brightness_variance = np.var(gray_sum) / 9
             
             if sky_ratio > 0.2 or grass_ratio > 0.3 or brightness_variance > 5000:
                 return True
@@ -192,195 +647,205 @@ class ImageClassifier:
         
         return False
     
-    def _apply_layer1_hard_rules(self, image: Image.Image, detections: Dict[str, float]) -> Optional[Tuple[str, str]]:
+    def _apply_layer1_hard_rules(self, image: Image.Image, detected: int) -> Optional[Tuple[RoomLabel, str]]:
         """
         Layer 1: Hard rules that override all other logic.
         
         Args:
             image: PIL Image
-            detections: Dictionary of detected objects with confidence scores
+            detected: Bitmask of detected objects (see _detect_objects_batch)
             
         Returns:
             Tuple of (label, rule_description) if a hard rule matches, None otherwise
         """
-        # Helper function to check detections
-        def has_object(keywords: List[str]) -> bool:
-            return any(kw in detections for kw in keywords)
+        # Fast path: with nothing detected, the pixel-based outdoor check
+        # (Hard Rule 6) is the only rule that can still match
+        if not detected:
+            if self._is_outdoor(image, detected):
+                return (RoomLabel.EXTERIOR, 'Layer 1 Hard Rule: Outdoor scene without furniture')
+            return None
         
         # Hard Rule 1: BATHROOM - If toilet, bathtub, or shower is detected
-        if has_object(['toilet', 'bathtub', 'shower', 'bathroom']):
-            return ('BATHROOM', 'Layer 1 Hard Rule: Bathroom fixture detected')
+        if detected & self._BATHROOM_FIXTURES:
+            return (RoomLabel.BATHROOM, 'Layer 1 Hard Rule: Bathroom fixture detected')
         
         # Hard Rule 2: LAUNDRY ROOM - Restrictive rule to reduce false positives
         # Must have: (both washer AND dryer) OR (at least one appliance AND laundry-specific indicator)
-        has_washer = has_object(['washing machine', 'washer'])
-        has_dryer = has_object(['dryer'])
-        has_laundry_indicator = has_object([
-            'detergent bottle', 'laundry detergent',
-            'utility sink',
-            'laundry basket',
-            'dryer vent', 'lint trap'
-        ])
+        has_washer = detected & self._WASHER
+        has_dryer = detected & self._DRYER
+        has_laundry_indicator = detected & self._LAUNDRY_INDICATORS
         
         # Condition 1: Both washer AND dryer visible
         if has_washer and has_dryer:
-            return ('LAUNDRY ROOM', 'Layer 1 Hard Rule: Both washer and dryer detected')
+            return (RoomLabel.LAUNDRY_ROOM, 'Layer 1 Hard Rule: Both washer and dryer detected')
         
         # Condition 2: At least one appliance AND laundry-specific indicator
         if (has_washer or has_dryer) and has_laundry_indicator:
-            return ('LAUNDRY ROOM', 'Layer 1 Hard Rule: Laundry appliance with laundry-specific indicator')
+            return (RoomLabel.LAUNDRY_ROOM, 'Layer 1 Hard Rule: Laundry appliance with laundry-specific indicator')
         
         # If conditions not met, do NOT classify as LAUNDRY ROOM (fall through to other rules)
         
         # Hard Rule 3: BEDROOM - If bed or mattress is detected
-        if has_object(['bed', 'mattress', 'bedroom bed']):
-            return ('BEDROOM', 'Layer 1 Hard Rule: Bed detected')
+        if detected & self._BED:
+            return (RoomLabel.BEDROOM, 'Layer 1 Hard Rule: Bed detected')
         
         # Hard Rule 4: OFFICE - If desk AND (chair OR computer) is detected
-        has_desk = has_object(['desk', 'office desk'])
-        has_chair = has_object(['chair', 'office chair'])
-        has_computer = has_object(['computer', 'laptop'])
+        has_desk = detected & self._DESK
+        has_chair = detected & self._CHAIR
+        has_computer = detected & self._COMPUTER
         
         if has_desk and (has_chair or has_computer):
-            return ('OFFICE', 'Layer 1 Hard Rule: Desk with chair or computer detected')
+            return (RoomLabel.OFFICE, 'Layer 1 Hard Rule: Desk with chair or computer detected')
         
         # Hard Rule 5: DECK - If outdoor scene AND (outdoor furniture OR railing) AND (trees/sky/siding)
-        is_outdoor = self._is_outdoor(image, detections)
-        has_outdoor_furniture = has_object(['outdoor furniture', 'patio furniture', 'outdoor chair', 'outdoor table'])
-        has_railing = has_object(['railing', 'deck railing'])
-        has_outdoor_features = has_object(['trees', 'sky', 'siding', 'house siding'])
+        is_outdoor = self._is_outdoor(image, detected)
+        has_outdoor_furniture = detected & self._OUTDOOR_FURNITURE
+        has_railing = detected & self._RAILING
+        has_outdoor_features = detected & self._OUTDOOR_FEATURES
         
         if is_outdoor and (has_outdoor_furniture or has_railing) and has_outdoor_features:
-            return ('DECK', 'Layer 1 Hard Rule: Outdoor scene with furniture/railing and trees/sky/siding')
+            return (RoomLabel.DECK, 'Layer 1 Hard Rule: Outdoor scene with furniture/railing and trees/sky/siding')
         
         # Hard Rule 6: EXTERIOR - If outdoor scene without furniture
-        if is_outdoor and not has_object(['outdoor furniture', 'patio furniture', 'outdoor chair', 'outdoor table', 'chair', 'table', 'couch', 'sofa', 'railing']):
-            return ('EXTERIOR', 'Layer 1 Hard Rule: Outdoor scene without furniture')
+        if is_outdoor and not detected & self._ANY_FURNITURE:
+            return (RoomLabel.EXTERIOR, 'Layer 1 Hard Rule: Outdoor scene without furniture')
         
         return None
     
-    def _apply_layer2_heuristic_rules(self, image: Image.Image, detections: Dict[str, float]) -> Optional[Tuple[str, str]]:
+    def _apply_layer2_heuristic_rules(self, image: Image.Image, detected: int) -> Optional[Tuple[RoomLabel, str]]:
         """
         Layer 2: Heuristic rules (applied if no hard rules match).
         
         Args:
             image: PIL Image
-            detections: Dictionary of detected objects with confidence scores
+            detected: Bitmask of detected objects (see _detect_objects_batch)
             
         Returns:
             Tuple of (label, rule_description) if a heuristic rule matches, None otherwise
         """
-        # Helper functions
-        def has_object(keywords: List[str]) -> bool:
-            return any(kw in detections for kw in keywords)
-        
-        def has_any_object(keyword_lists: List[List[str]]) -> bool:
-            return any(any(kw in detections for kw in keywords) for keywords in keyword_lists)
-        
         # Heuristic Rule 1: KITCHEN - sink + refrigerator OR stove + cabinets
-        has_sink = has_object(['kitchen sink', 'sink'])
-        has_refrigerator = has_object(['refrigerator', 'fridge'])
-        has_stove = has_object(['stove', 'oven'])
-        has_cabinets = has_object(['kitchen cabinets', 'cabinet'])
+        has_sink = detected & self._SINK
+        has_refrigerator = detected & self._REFRIGERATOR
+        has_stove = detected & self._STOVE
+        has_cabinets = detected & self._CABINETS
         
         if (has_sink and has_refrigerator) or (has_stove and has_cabinets):
-            return ('KITCHEN', 'Layer 2 Heuristic: Kitchen appliances detected (sink+fridge OR stove+cabinets)')
+            return (RoomLabel.KITCHEN, 'Layer 2 Heuristic: Kitchen appliances detected (sink+fridge OR stove+cabinets)')
         
         # Heuristic Rule 2: DINING ROOM - table present, no bed, no appliances
-        has_table = has_object(['dining table', 'table', 'dining room table'])
-        has_bed = has_object(['bed', 'mattress'])
-        has_appliances = has_any_object([
-            ['refrigerator', 'fridge'],
-            ['stove', 'oven'],
-            ['washing machine', 'dryer']
-        ])
+        has_table = detected & self._TABLE
+        has_bed = detected & self._BED_OR_MATTRESS
+        has_appliances = detected & self._APPLIANCES
         
         if has_table and not has_bed and not has_appliances:
-            return ('DINING ROOM', 'Layer 2 Heuristic: Table detected, no bed or appliances')
+            return (RoomLabel.DINING_ROOM, 'Layer 2 Heuristic: Table detected, no bed or appliances')
         
         # Heuristic Rule 3: LIVING ROOM - couch/sofa AND (TV OR fireplace)
-        has_couch = has_object(['couch', 'sofa'])
-        has_tv = has_object(['television', 'tv', 'tv screen'])
-        has_fireplace = has_object(['fireplace'])
+        has_couch = detected & self._COUCH
+        has_tv = detected & self._TV
+        has_fireplace = detected & self._FIREPLACE
         
         if has_couch and (has_tv or has_fireplace):
-            return ('LIVING ROOM', 'Layer 2 Heuristic: Couch/sofa with TV or fireplace')
+            return (RoomLabel.LIVING_ROOM, 'Layer 2 Heuristic: Couch/sofa with TV or fireplace')
         
         return None
     
-    def _apply_layer3_hf_classifier(self, image: Image.Image) -> Optional[Tuple[str, str]]:
+    def _apply_layer3_hf_classifier_batch(self, image_feats: torch.Tensor) -> List[Optional[Tuple[RoomLabel, str]]]:
         """
         Layer 3: Hugging Face classifier (fallback only).
         Uses CLIP zero-shot classification to classify room types.
         
         Args:
-            image: PIL Image
+            image_feats: Image embeddings from _encode_images for the images that reached Layer 3
             
         Returns:
-            Tuple of (label, confidence_score) if confidence >= threshold, None otherwise
+            One entry per image: (label, confidence_score) if confidence >= threshold, None otherwise
         """
-        if not self.clip_model or not self.clip_processor:
-            return None
-        
-        # Room type labels for zero-shot classification
-        room_labels = [
-            'kitchen',
-            'living room',
-            'bedroom',
-            'office',
-            'dining room',
-            'laundry room',
-            'deck',
-            'exterior',
-            'bathroom'
-        ]
-        
         try:
-            # Process image and text labels
-            inputs = self.clip_processor(
-                text=room_labels,
-                images=image,
-                return_tensors="pt",
-                padding=True
-            )
-            
-            # Run inference
-            with torch.no_grad():
-                outputs = self.clip_model(**inputs)
-            
-            # Get similarity scores
-            logits_per_image = outputs.logits_per_image
-            probs = logits_per_image.softmax(dim=1)
-            
-            # Find top prediction
-            top_idx = torch.argmax(probs, dim=1).item()
-            top_confidence = float(probs[0][top_idx].item())
-            top_label = room_labels[top_idx]
-            
-            # Map to canonical label
-            label_mapping = {
-                'kitchen': 'KITCHEN',
-                'living room': 'LIVING ROOM',
-                'bedroom': 'BEDROOM',
-                'office': 'OFFICE',
-                'dining room': 'DINING ROOM',
-                'laundry room': 'LAUNDRY ROOM',
-                'deck': 'DECK',
-                'exterior': 'EXTERIOR',
-                'bathroom': 'BATHROOM'
-            }
-            
-            canonical_label = label_mapping.get(top_label, 'OTHER')
-            
-            # Only return if confidence meets threshold
-            if top_confidence >= self.HF_CLASSIFIER_THRESHOLD:
-                return (canonical_label, f'Layer 3 HF Classifier: {top_label} (confidence: {top_confidence:.3f})')
+            # Score against the cached room label embeddings, reusing the image features
+            # One device-to-host copy for the whole (N, 9) matrix instead of a sync per result tensor
+            probs = self._score_against(image_feats, self._room_text_feats).cpu()
+            
+            # Find top prediction per image
+            top_confidences, top_indices = probs.max(dim=1)
+            
+            results = []
+            for top_idx, top_confidence in zip(top_indices.tolist(), top_confidences.tolist()):
+                top_label = self.ROOM_LABELS[top_idx]
+                # ROOM_LABELS columns are in RoomLabel order
+                canonical_label = RoomLabel(top_idx)
+                
+                # Only return if confidence meets threshold
+                if top_confidence >= self.HF_CLASSIFIER_THRESHOLD:
+                    results.append((canonical_label, f'Layer 3 HF Classifier: {top_label} (confidence: {top_confidence:.3f})'))
+                else:
+                    results.append(None)
             
-            return None
+            return results
             
         except Exception as e:
             logger.error(f"Error in Hugging Face classifier: {e}")
+            return [None for _ in range(len(image_feats))]
+    
+    def _apply_rule_layers(self, image: Image.Image, detections: Dict[str, float], detected: int) -> Optional[RoomLabel]:
+        """
+        Log detections and apply Layer 1 (hard rules) then Layer 2 (heuristics).
+        
+        Args:
+            image: PIL Image
+            detections: Dictionary of detected objects with confidence scores (for logging)
+            detected: Bitmask of the same detections (see _detect_objects_batch)
+            
+        Returns:
+            Classification label if a rule matched, None to fall through to Layer 3
+        """
+        # Log detected objects and confidence scores
+        if detections:
+            detection_str = ", ".join([f"{obj}({conf:.2f})" for obj, conf in sorted(detections.items(), key=lambda x: x[1], reverse=True)])
+            logger.info(f"Detected objects: {detection_str}")
+        else:
+            logger.info("No objects detected above threshold")
+        
+        # Layer 1 - Hard rules (override all)
+        layer1_result = self._apply_layer1_hard_rules(image, detected)
+        if layer1_result:
+            final_label, rule_description = layer1_result
+            logger.info(f"Layer 1 (Hard Rule): {rule_description}")
+            logger.info(f"Final classification: {LABEL_NAMES[final_label]}")
+            return final_label
+        
+        # Layer 2 - Heuristic rules (every heuristic needs at least one detected object)
+        if not detected:
             return None
+        layer2_result = self._apply_layer2_heuristic_rules(image, detected)
+        if layer2_result:
+            final_label, rule_description = layer2_result
+            logger.info(f"Layer 2 (Heuristic): {rule_description}")
+            logger.info(f"Final classification: {LABEL_NAMES[final_label]}")
+            return final_label
+        
+        return None
+    
+    def _resolve_layer3_result(self, layer3_result: Optional[Tuple[RoomLabel, str]]) -> RoomLabel:
+        """
+        Turn a Layer 3 result into the final label, defaulting to OTHER.
+        
+        Args:
+            layer3_result: Output of the Layer 3 classifier for one image
+            
+        Returns:
+            Classification label
+        """
+        if layer3_result:
+            final_label, rule_description = layer3_result
+            logger.info(f"Layer 3 (HF Classifier): {rule_description}")
+            logger.info(f"Final classification: {LABEL_NAMES[final_label]}")
+            return final_label
+        
+        # No rules matched and HF classifier below threshold
+        logger.info("Layer 3: No rules matched and HF classifier below threshold")
+        logger.info("Final classification: OTHER")
+        return RoomLabel.OTHER
     
     def classify_image(self, image_path: str) -> str:
         """
@@ -395,70 +860,16 @@ class ImageClassifier:
         Returns:
             Classification label (ALL CAPS)
         """
-        try:
-            # Load image
-            image = self._load_image_from_path(image_path)
-            
-            if not image:
-                logger.warning(f"Could not load image: {image_path}")
-                return 'OTHER'
-            
-            # Step 1: Detect objects using CLIP
-            detections = self._detect_objects(image)
-            
-            # Log detected objects and confidence scores
-            if detections:
-                detection_str = ", ".join([f"{obj}({conf:.2f})" for obj, conf in sorted(detections.items(), key=lambda x: x[1], reverse=True)])
-                logger.info(f"Detected objects: {detection_str}")
-            else:
-                logger.info("No objects detected above threshold")
-            
-            # Step 2: Apply Layer 1 - Hard rules (override all)
-            layer1_result = self._apply_layer1_hard_rules(image, detections)
-            if layer1_result:
-                final_label, rule_description = layer1_result
-                logger.info(f"Layer 1 (Hard Rule): {rule_description}")
-                logger.info(f"Final classification: {final_label}")
-                if final_label not in self.CANONICAL_LABELS:
-                    logger.warning(f"Label {final_label} not in allowed set, defaulting to OTHER")
-                    return 'OTHER'
-                return final_label
-            
-            # Step 3: Apply Layer 2 - Heuristic rules
-            layer2_result = self._apply_layer2_heuristic_rules(image, detections)
-            if layer2_result:
-                final_label, rule_description = layer2_result
-                logger.info(f"Layer 2 (Heuristic): {rule_description}")
-                logger.info(f"Final classification: {final_label}")
-                if final_label not in self.CANONICAL_LABELS:
-                    logger.warning(f"Label {final_label} not in allowed set, defaulting to OTHER")
-                    return 'OTHER'
-                return final_label
-            
-            # Step 4: Apply Layer 3 - Hugging Face classifier (fallback)
-            layer3_result = self._apply_layer3_hf_classifier(image)
-            if layer3_result:
-                final_label, rule_description = layer3_result
-                logger.info(f"Layer 3 (HF Classifier): {rule_description}")
-                logger.info(f"Final classification: {final_label}")
-                if final_label not in self.CANONICAL_LABELS:
-                    logger.warning(f"Label {final_label} not in allowed set, defaulting to OTHER")
-                    return 'OTHER'
-                return final_label
-            
-            # No rules matched and HF classifier below threshold
-            logger.info("Layer 3: No rules matched and HF classifier below threshold")
-            logger.info("Final classification: OTHER")
-            return 'OTHER'
-            
-        except Exception as e:
-            logger.error(f"Error classifying image {image_path}: {e}", exc_info=True)
-            return 'OTHER'
+        return self._classify_batch([image_path], [self._load_image_from_path(image_path)])[0]
     
     def classify_images(self, image_paths: List[str]) -> List[Tuple[str, str]]:
         """
         Classify multiple images from local file paths.
         
+        Images are classified in batches of `batch_size` so CLIP runs one
+        forward pass per batch instead of one per image. The next batch is
+        decoded on a thread pool while the current one is being classified.
+        
         Args:
             image_paths: List of image file paths
             
@@ -466,7 +877,81 @@ class ImageClassifier:
             List of tuples (file_path, classification)
         """
         results = []
-        for image_path in image_paths:
-            classification = self.classify_image(image_path)
-            results.append((image_path, classification))
+        paths = iter(image_paths)
+        max_workers = min(self.batch_size, os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            batch_paths = list(islice(paths, self.batch_size))
+            batch_images = executor.map(self._load_image_from_path, batch_paths)
+            
+            while batch_paths:
+                # Start decoding the next batch so it overlaps CLIP inference on this one
+                next_paths = list(islice(paths, self.batch_size))
+                next_images = executor.map(self._load_image_from_path, next_paths)
+                
+                labels = self._classify_batch(batch_paths, list(batch_images))
+                results.extend(zip(batch_paths, labels))
+                
+                batch_paths, batch_images = next_paths, next_images
+        
         return results
+    
+    def _classify_batch(self, image_paths: List[str], images: List[Optional[Image.Image]]) -> List[str]:
+        """
+        Classify one batch of images with the three-layer approach.
+        
+        Args:
+            image_paths: List of image file paths
+            images: Loaded images for image_paths (None where loading failed)
+            
+        Returns:
+            Classification labels (ALL CAPS), in the same order as image_paths
+        """
+        labels = [RoomLabel.OTHER] * len(image_paths)
+        
+        loaded = []
+        for i, image in enumerate(images):
+            if image is None:
+                logger.warning(f"Could not load image: {image_paths[i]}")
+            else:
+                loaded.append(i)
+        
+        # Step 1: Encode each image once; object detection and Layer 3 share these features
+        image_feats, encoded = self._encode_images([images[i] for i in loaded])
+        # Row of image_feats for each position in loaded (images that failed to encode have none)
+        feat_rows = {pos: row for row, pos in enumerate(encoded)}
+        
+        # Step 2: Detect objects using CLIP (no detections for images that failed to encode)
+        batch_detections, batch_masks = [{} for _ in loaded], [0] * len(loaded)
+        if image_feats is not None:
+            encoded_detections, encoded_masks = self._detect_objects_batch(image_feats)
+            for pos, detections, detected in zip(encoded, encoded_detections, encoded_masks):
+                batch_detections[pos] = detections
+                batch_masks[pos] = detected
+        
+        # Steps 3-4: Apply Layer 1 and Layer 2 rules per image
+        pending = []  # Positions in loaded that fall through to Layer 3
+        for pos, (i, detections, detected) in enumerate(zip(loaded, batch_detections, batch_masks)):
+            try:
+                rule_label = self._apply_rule_layers(images[i], detections, detected)
+            except Exception as e:
+                logger.error(f"Error classifying image {image_paths[i]}: {e}", exc_info=True)
+                continue
+            
+            # RoomLabel.KITCHEN is 0, so test against None rather than truthiness
+            if rule_label is not None:
+                labels[i] = rule_label
+            else:
+                pending.append(pos)
+        
+        # Step 5: Apply Layer 3 - Hugging Face classifier (fallback) on the features already computed
+        layer3_positions = [pos for pos in pending if pos in feat_rows]
+        layer3_results = {}
+        if layer3_positions:
+            rows = [feat_rows[pos] for pos in layer3_positions]
+            layer3_results = dict(zip(layer3_positions, self._apply_layer3_hf_classifier_batch(image_feats[rows])))
+        for pos in pending:
+            labels[loaded[pos]] = self._resolve_layer3_result(layer3_results.get(pos))
+        
+        # Labels stay RoomLabel values through the layers; convert to names only here
+        return [LABEL_NAMES[label] for label in labels]
@@ -1,17 +1,69 @@
 """File saving and naming utilities."""
+import errno
+import os
 import shutil
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List, Tuple, Dict, Set
 import logging
 from io import BytesIO
-from PIL import Image, ImageFile
+import numpy as np
+from PIL import Image, ImageFile, features
+# Register just the decoders for the formats the processor accepts. Image.open can
+# then identify every input without falling back to Image.init(), which imports
+# all of Pillow's ~40 format plugins on the first WEBP/TIFF opened.
+from PIL import BmpImagePlugin, GifImagePlugin, JpegImagePlugin, PngImagePlugin, TiffImagePlugin, WebPImagePlugin  # noqa: F401
 
 # Enable truncated image loading to handle partially malformed WEBP files
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 
 logger = logging.getLogger(__name__)
 
+# Optional: PyTurboJPEG (needs the libjpeg-turbo shared library) decodes/encodes JPEGs
+# straight from/to NumPy arrays through the TurboJPEG API, bypassing Pillow's codec layer
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420, TJSAMP_444
+    _turbojpeg = TurboJPEG()
+except Exception:
+    _turbojpeg = None
+
+# Lowercased names of the files in each output directory, listed once and then kept
+# up to date as names are claimed, so collision checks do not stat() every candidate
+_dir_names: Dict[Path, Set[str]] = {}
+_dir_names_lock = threading.Lock()
+
+# Output directories already created this run, so mkdir is issued once per directory
+_ensured_dirs: Set[Path] = set()
+
+# Output directories that passed ensure_output_dir's write probe
+_validated_dirs: Set[Path] = set()
+
+# Room types allowed in filenames (matches three-layer classifier labels)
+VALID_CLASSIFICATIONS = frozenset({
+    'KITCHEN', 'LIVING ROOM', 'BEDROOM', 'OFFICE',
+    'DINING ROOM', 'LAUNDRY ROOM', 'DECK', 'EXTERIOR', 'BATHROOM', 'OTHER'
+})
+
+# Extensions whose files may already be baseline JPEGs that can skip re-encoding
+PASSTHROUGH_JPEG_EXTENSIONS = {'.jpg', '.jpeg', '.jfif'}
+
+# JPEG markers (second byte after 0xFF) inspected by _scan_baseline_jpeg
+_JPEG_SOI = 0xD8
+_JPEG_EOI = 0xD9
+_JPEG_SOF0 = 0xC0
+_JPEG_SOS = 0xDA
+_JPEG_APP0 = 0xE0
+_JPEG_APP14 = 0xEE
+_JPEG_APP15 = 0xEF
+_JPEG_COM = 0xFE
+
+# Cleared after the first failed attempt to start jpegtran (not installed)
+_jpegtran_available = True
+
 
 def generate_filename(account_no: str, classification: str, index: int) -> str:
     """
@@ -30,25 +82,34 @@ def generate_filename(account_no: str, classification: str, index: int) -> str:
     Returns:
         Filename string in format: ACCOUNTNO – MLS – ROOMTYPE X.JPG
     """
-    # Ensure classification is valid and ALL CAPS (matches three-layer classifier labels)
-    valid_classifications = {
-        'KITCHEN', 'LIVING ROOM', 'BEDROOM', 'OFFICE',
-        'DINING ROOM', 'LAUNDRY ROOM', 'DECK', 'EXTERIOR', 'BATHROOM', 'OTHER'
-    }
+    # Only the index changes between calls for the same account/room type
+    return f"{_filename_prefix(str(account_no), classification)}{index}.JPG"
+
+
+@lru_cache(maxsize=256)
+def _filename_prefix(account_no: str, classification: str) -> str:
+    """
+    Build the "ACCOUNTNO - MLS - ROOMTYPE " part of a filename (cached per pair).
     
+    Args:
+        account_no: Account number
+        classification: Room classification
+        
+    Returns:
+        Normalized filename prefix, ending with the space before the index
+    """
     # Normalize classification to ALL CAPS
     classification = classification.upper().strip()
     
-    if classification not in valid_classifications:
+    if classification not in VALID_CLASSIFICATIONS:
         classification = 'OTHER'
     
     # Ensure account number is ALL CAPS
-    account_no = str(account_no).upper().strip()
+    account_no = account_no.upper().strip()
     
     # Format: ACCOUNTNO - MLS - ROOMTYPE X.JPG
     # Using regular dash with spaces as specified: " - "
-    filename = f"{account_no} - MLS - {classification} {index}.JPG"
-    return filename
+    return f"{account_no} - MLS - {classification} "
 
 
 def copy_and_rename_image(
@@ -69,31 +130,244 @@ def copy_and_rename_image(
     """
     try:
         # Ensure output directory exists
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(dest_dir)
         
         # Handle filename collisions
-        full_path = dest_dir / filename
-        counter = 1
-        base_name = filename.rsplit('.', 1)[0] if '.' in filename else filename
-        ext = filename.rsplit('.', 1)[1] if '.' in filename else 'JPG'
-        
-        while full_path.exists():
-            # Add counter before extension
-            new_filename = f"{base_name}_{counter}.{ext}"
-            full_path = dest_dir / new_filename
-            counter += 1
+        full_path = _unique_image_path(dest_dir, filename)
         
         # Copy file
-        shutil.copy2(source_path, full_path)
-        
-        logger.info(f"Copied and renamed image: {source_path.name} -> {full_path.name}")
-        return full_path
+        return _copy_image(source_path, full_path)
         
     except Exception as e:
         logger.error(f"Error copying image {source_path}: {e}")
         return None
 
 
+def copy_and_rename_images(
+    jobs: List[Tuple[Path, str]],
+    dest_dir: Path,
+    max_workers: int = 8
+) -> List[Optional[Path]]:
+    """
+    Copy and rename a batch of images into one directory with overlapped I/O.
+    
+    Destination names are resolved up front, with the same collision handling as
+    copy_and_rename_image. The copies then run on a thread pool, so several
+    reads/writes are in flight at once instead of one file round-trip at a time.
+    
+    Args:
+        jobs: List of (source_path, filename) pairs
+        dest_dir: Directory to copy images to
+        max_workers: Maximum number of concurrent copies
+        
+    Returns:
+        Full path to each copied file (None if that copy failed), in job order
+    """
+    if not jobs:
+        return []
+    
+    try:
+        # Ensure output directory exists
+        _ensure_dir(dest_dir)
+    except Exception as e:
+        logger.error(f"Error creating output directory {dest_dir}: {e}")
+        return [None] * len(jobs)
+    
+    # Handle filename collisions (names taken by earlier jobs in this batch count as taken)
+    targets = []
+    for source_path, filename in jobs:
+        try:
+            targets.append(_unique_image_path(dest_dir, filename))
+        except Exception as e:
+            logger.error(f"Error copying image {source_path}: {e}")
+            targets.append(None)
+    
+    def copy_one(source_path: Path, full_path: Optional[Path]) -> Optional[Path]:
+        if full_path is None:
+            return None
+        try:
+            return _copy_image(source_path, full_path)
+        except Exception as e:
+            logger.error(f"Error copying image {source_path}: {e}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+        return list(executor.map(copy_one, [source for source, _ in jobs], targets))
+
+
+def _unique_image_path(dest_dir: Path, filename: str) -> Path:
+    """
+    Pick and claim a destination path for filename that does not collide with an existing file.
+    
+    Args:
+        dest_dir: Directory the file will be copied to
+        filename: Desired filename
+        
+    Returns:
+        dest_dir / filename, or dest_dir / "NAME_N.EXT" for the first free N
+    """
+    name = Path(filename)
+    return _claim_unique_path(dest_dir, name.stem, name.suffix[1:] or 'JPG')
+
+
+def _claim_unique_path(dest_dir: Path, base_name: str, ext: str) -> Path:
+    """
+    Pick the first free "BASE.EXT" / "BASE_N.EXT" name in dest_dir and mark it as taken.
+    
+    The directory is listed once; later calls check the cached name set in memory.
+    Names are compared case-insensitively, as on Windows, so a claimed name never
+    overwrites an existing file. The claim is recorded immediately, so concurrent
+    or batched copies into the same directory never pick the same name.
+    
+    Args:
+        dest_dir: Existing destination directory
+        base_name: Filename without extension
+        ext: Extension without the dot
+        
+    Returns:
+        Full path of the claimed name
+    """
+    with _dir_names_lock:
+        names = _dir_names.get(dest_dir)
+        if names is None:
+            with os.scandir(dest_dir) as entries:
+                names = {entry.name.lower() for entry in entries}
+            _dir_names[dest_dir] = names
+        
+        filename = f"{base_name}.{ext}"
+        counter = 1
+        while filename.lower() in names:
+            # Add counter before extension
+            filename = f"{base_name}_{counter}.{ext}"
+            counter += 1
+        
+        names.add(filename.lower())
+    
+    return dest_dir / filename
+
+
+def _release_claimed_path(path: Path) -> None:
+    """
+    Give back a name claimed by _claim_unique_path that was never written.
+    
+    Called when a conversion fails after claiming its output name, so later
+    files are not suffixed past a name that does not exist on disk.
+    
+    Args:
+        path: Path previously returned by _claim_unique_path
+    """
+    with _dir_names_lock:
+        names = _dir_names.get(path.parent)
+        if names is not None and not path.exists():
+            names.discard(path.name.lower())
+
+
+def _fast_copy(source_path: Path, dest_path: Path) -> None:
+    """
+    Copy a file's data and timestamps (like shutil.copy2) through the OS copy path.
+    
+    On Windows this is a single CopyFileW call, so the copy runs in the kernel
+    instead of shutil's user-space read/write loop. On Linux the data moves with
+    os.copy_file_range (in-kernel, and a reflink/server-side copy on filesystems
+    that support it), or os.sendfile where that is unavailable, without passing
+    through Python buffers. Other platforms use shutil.copy2, which already uses
+    fcopyfile on macOS.
+    
+    Args:
+        source_path: File to copy
+        dest_path: Destination file path (overwritten if it exists)
+        
+    Raises:
+        OSError: If the copy fails
+    """
+    if sys.platform == "win32":
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileW(str(source_path), str(dest_path), False):
+            raise ctypes.WinError()
+        return
+    
+    if sys.platform.startswith("linux"):
+        src_fd = os.open(source_path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
+            try:
+                remaining = os.fstat(src_fd).st_size
+                offset = 0
+                copy_range = getattr(os, "copy_file_range", None)  # Python 3.8+
+                while remaining > 0:
+                    try:
+                        if copy_range is not None:
+                            sent = copy_range(src_fd, dst_fd, remaining, offset, offset)
+                        else:
+                            sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                    except OSError as e:
+                        # Older kernels refuse copy_file_range across filesystems (EXDEV)
+                        # or lack it entirely; nothing written yet, so retry with sendfile
+                        if offset == 0 and copy_range is not None and e.errno in (
+                            errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EPERM
+                        ):
+                            copy_range = None
+                            continue
+                        # Some filesystems (e.g. certain network mounts) do not support
+                        # sendfile; nothing has been written yet, so use shutil instead
+                        if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP):
+                            break
+                        raise
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        if remaining == 0:
+            shutil.copystat(source_path, dest_path)
+            return
+    
+    shutil.copy2(source_path, dest_path)
+
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Create a directory (and parents) unless it was already created this run.
+    
+    Args:
+        path: Directory path
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def forget_dir_listings() -> None:
+    """
+    Drop the cached output directory listings and created-directory set.
+    
+    Call before processing a new folder so files and directories added or
+    removed outside the app since the last run are picked up.
+    """
+    with _dir_names_lock:
+        _dir_names.clear()
+        _ensured_dirs.clear()
+
+
+def _copy_image(source_path: Path, full_path: Path) -> Path:
+    """
+    Copy an image to its resolved destination path and log the rename.
+    
+    Args:
+        source_path: Path to source image file
+        full_path: Collision-free destination path
+        
+    Returns:
+        full_path
+    """
+    _fast_copy(source_path, full_path)
+    logger.info(f"Copied and renamed image: {source_path.name} -> {full_path.name}")
+    return full_path
+
+
 def rename_pdf(pdf_path: Path, account_no: str, output_dir: Path) -> Optional[Path]:
     """
     Rename PDF file to just the account number.
@@ -108,25 +382,16 @@ def rename_pdf(pdf_path: Path, account_no: str, output_dir: Path) -> Optional[Pa
     """
     try:
         # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_dir)
         
         # Generate filename: ACCOUNTNO.PDF
         account_no = str(account_no).upper().strip()
-        filename = f"{account_no}.PDF"
         
         # Handle filename collisions
-        full_path = output_dir / filename
-        counter = 1
-        base_name = account_no
-        
-        while full_path.exists():
-            # Add counter before extension
-            new_filename = f"{base_name}_{counter}.PDF"
-            full_path = output_dir / new_filename
-            counter += 1
+        full_path = _claim_unique_path(output_dir, account_no, "PDF")
         
         # Copy PDF file
-        shutil.copy2(pdf_path, full_path)
+        _fast_copy(pdf_path, full_path)
         
         logger.info(f"Renamed PDF: {pdf_path.name} -> {full_path.name}")
         return full_path
@@ -136,7 +401,111 @@ def rename_pdf(pdf_path: Path, account_no: str, output_dir: Path) -> Optional[Pa
         return None
 
 
-def convert_to_jpeg(source_path: Path, output_dir: Path) -> Optional[Path]:
+def _scan_baseline_jpeg(path: Path) -> Optional[bool]:
+    """
+    Check whether a file is already a RealWare-compatible JPEG, apart from metadata.
+    
+    Scans the marker segments up to the start of scan, reading only the segment
+    headers, and requires: a baseline (SOF0) 8-bit 3-component frame, no Adobe
+    (APP14) color transform, and an end-of-image marker (so truncated files
+    still go through a full re-encode).
+    
+    Args:
+        path: Path to candidate JPEG file
+        
+    Returns:
+        None if the file must be re-encoded; otherwise whether it carries metadata
+        that still has to be stripped: any APPn segment other than the JFIF
+        header (APP0), e.g. EXIF/XMP (APP1), ICC profiles (APP2) or maker
+        data, or a comment (COM)
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read(2) != bytes((0xFF, _JPEG_SOI)):
+                return None
+            
+            is_baseline = False
+            has_metadata = False
+            while True:
+                header = f.read(4)
+                if len(header) < 4 or header[0] != 0xFF:
+                    return None
+                marker = header[1]
+                length = int.from_bytes(header[2:4], 'big')
+                if length < 2:
+                    return None
+                
+                if marker == _JPEG_SOS:
+                    break
+                if marker == _JPEG_APP14:
+                    # Adobe color transform: needs a real color conversion
+                    return None
+                if _JPEG_APP0 < marker <= _JPEG_APP15 or marker == _JPEG_COM:
+                    has_metadata = True
+                elif 0xC1 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    # Progressive, lossless, extended or arithmetic-coded frame
+                    return None
+                elif marker == _JPEG_SOF0:
+                    frame = f.read(6)
+                    # Frame header: precision, height (2), width (2), component count
+                    if len(frame) < 6 or frame[0] != 8 or frame[5] != 3:
+                        return None
+                    is_baseline = True
+                    f.seek(length - 2 - len(frame), 1)
+                    continue
+                f.seek(length - 2, 1)
+            
+            if not is_baseline:
+                return None
+            
+            # Truncated files are repaired by the decode/encode path, so only pass complete ones
+            f.seek(-2, 2)
+            if f.read(2) != bytes((0xFF, _JPEG_EOI)):
+                return None
+            return has_metadata
+    except OSError:
+        return None
+
+
+def _strip_jpeg_metadata(source_path: Path, output_path: Path) -> bool:
+    """
+    Losslessly copy a baseline JPEG without its metadata using jpegtran.
+    
+    jpegtran rewrites the entropy-coded data without decoding pixels, dropping
+    all markers (-copy none) and keeping the output baseline.
+    
+    Args:
+        source_path: Baseline JPEG with APPn/COM metadata
+        output_path: Destination path
+        
+    Returns:
+        True if the stripped copy was written, False if jpegtran is unavailable or failed
+    """
+    global _jpegtran_available
+    if not _jpegtran_available:
+        return False
+    
+    try:
+        subprocess.run(
+            ["jpegtran", "-copy", "none", "-optimize", "-outfile", str(output_path), str(source_path)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return True
+    except FileNotFoundError:
+        logger.info("jpegtran not found; JPEGs with metadata will be re-encoded")
+        _jpegtran_available = False
+    except Exception as e:
+        logger.warning(f"jpegtran failed for {source_path.name}, re-encoding instead: {e}")
+    return False
+
+
+def convert_to_jpeg(
+    source_path: Path,
+    output_dir: Path,
+    magick_queue: Optional[List[Tuple[Path, Path]]] = None
+) -> Optional[Path]:
     """
     Convert image file to JPEG format silently with RealWare compatibility.
     
@@ -155,17 +524,48 @@ def convert_to_jpeg(source_path: Path, output_dir: Path) -> Optional[Path]:
     Args:
         source_path: Path to source image file
         output_dir: Directory to save converted JPEG (processed folder)
+        magick_queue: If given, a WEBP that needs the ImageMagick fallback is appended
+            here as (source_path, output_path) and None is returned, so the caller can
+            convert all such files in one ImageMagick process (see convert_folder_to_jpeg)
         
     Returns:
-        Full path to converted JPEG file, or None if failed
+        Full path to converted JPEG file, or None if failed (or queued for ImageMagick)
     """
     # Get original extension for logging (before try block for error handling)
     original_ext = source_path.suffix.upper()
     is_webp = original_ext in ['.WEBP', '.webp']
+    output_path = None
     
     try:
         # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_dir)
+        
+        # Generate output filename (same name but .JPG extension), handling collisions
+        output_path = _claim_unique_path(output_dir, source_path.stem, "JPG")
+        
+        # A source that is already a RealWare-compatible JPEG (e.g. .JFIF downloads) is
+        # copied byte for byte, or with only its metadata losslessly stripped:
+        # re-encoding would cost a full decode/encode and lose quality
+        if source_path.suffix.lower() in PASSTHROUGH_JPEG_EXTENSIONS:
+            has_metadata = _scan_baseline_jpeg(source_path)
+            if has_metadata is False:
+                _fast_copy(source_path, output_path)
+                logger.info(f"Copied baseline JPEG without re-encoding ({original_ext} → JPG): {source_path.name}")
+                return output_path
+            if has_metadata and _strip_jpeg_metadata(source_path, output_path):
+                logger.info(f"Stripped baseline JPEG metadata without re-encoding ({original_ext} → JPG): {source_path.name}")
+                return output_path
+            
+            # Otherwise (e.g. progressive) decode and re-encode entirely in TurboJPEG when available
+            if _turbojpeg is not None:
+                try:
+                    pixels = _turbojpeg.decode(source_path.read_bytes(), pixel_format=TJPF_RGB)
+                except Exception as e:
+                    logger.debug(f"TurboJPEG decode failed, using Pillow: {source_path.name} ({e})")
+                else:
+                    if _turbojpeg_save(pixels, output_path, TJSAMP_444):
+                        logger.info(f"Converted {original_ext} → JPG: {source_path.name}")
+                        return output_path
         
         # Force full pixel decode with robust fallback path for malformed WEBP files
         source_img = None
@@ -173,9 +573,21 @@ def convert_to_jpeg(source_path: Path, output_dir: Path) -> Optional[Path]:
         
         # PRIMARY decode path
         try:
-            source_img = Image.open(source_path)
-            source_img.load()  # FORCE full pixel decode immediately
+            # Open the file ourselves so the handle is closed as soon as the pixels are
+            # decoded, independent of when (or whether) the image object is closed
+            with open(source_path, "rb") as f:
+                source_img = Image.open(f)
+                source_img.load()  # FORCE full pixel decode immediately
         except Exception as e:
+            if source_img is not None:
+                source_img.close()
+                source_img = None
+            if not is_webp:
+                # The in-memory retry below only rescues malformed WEBPs; any other
+                # format would just fail a second full read and decode the same way
+                logger.error(f"Image decode failed: {source_path.name} ({e})")
+                return None
+            
             # FALLBACK decode path for malformed WEBPs
             logger.warning(f"Primary WEBP decode failed, attempting fallback: {source_path.name} ({e})")
             try:
@@ -190,32 +602,23 @@ def convert_to_jpeg(source_path: Path, output_dir: Path) -> Optional[Path]:
         # Convert to RGB only after decode succeeds
         try:
             if source_img.mode == "RGBA":
-                img = Image.new("RGB", source_img.size, (255, 255, 255))
-                img.paste(source_img, mask=source_img.split()[3])
+                img = _composite_over_white(source_img)
+            elif source_img.mode == "RGB":
+                # Already RGB: convert() would only copy every pixel
+                img = source_img
             else:
+                logger.debug(f"Converting {source_img.mode} → RGB: {source_path.name}")
                 img = source_img.convert("RGB")
             
             img.load()  # Ensure pixels are fully materialized
         finally:
-            # Close source image after conversion
-            if source_img is not None:
+            # Close source image after conversion (unless it is the image being saved)
+            if source_img is not None and source_img is not img:
                 try:
                     source_img.close()
                 except Exception:
                     pass
         
-        # Generate output filename (same name but .JPG extension)
-        base_name = source_path.stem
-        output_filename = f"{base_name}.JPG"
-        output_path = output_dir / output_filename
-        
-        # Handle filename collisions
-        counter = 1
-        while output_path.exists():
-            output_filename = f"{base_name}_{counter}.JPG"
-            output_path = output_dir / output_filename
-            counter += 1
-        
         # Save as baseline JPEG with RealWare-compatible settings
         save_kwargs = dict(
             format="JPEG",
@@ -230,7 +633,14 @@ def convert_to_jpeg(source_path: Path, output_dir: Path) -> Optional[Path]:
             save_kwargs["optimize"] = True
             save_kwargs["subsampling"] = 0
         
-        img.save(output_path, **save_kwargs)
+        # TurboJPEG encodes straight from the pixel buffer (same subsampling as Pillow would use);
+        # its TJSAMP_* constants only exist when the optional import succeeded
+        saved = False
+        if _turbojpeg is not None:
+            subsample = TJSAMP_420 if is_webp else TJSAMP_444
+            saved = _turbojpeg_save(np.asarray(img), output_path, subsample)
+        if not saved:
+            img.save(output_path, **save_kwargs)
         
         # Log conversion with format: "Converted WEBP → JPG: filename.webp"
         logger.info(f"Converted {original_ext} → JPG: {source_path.name}")
@@ -245,30 +655,16 @@ def convert_to_jpeg(source_path: Path, output_dir: Path) -> Optional[Path]:
             )
             
             try:
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_path = output_dir / f"{source_path.stem}.JPG"
+                _ensure_dir(output_dir)
+                if output_path is None:
+                    # Handle filename collisions
+                    output_path = _claim_unique_path(output_dir, source_path.stem, "JPG")
                 
-                # Handle filename collisions
-                counter = 1
-                while output_path.exists():
-                    output_path = output_dir / f"{source_path.stem}_{counter}.JPG"
-                    counter += 1
+                if magick_queue is not None:
+                    magick_queue.append((source_path, output_path))
+                    return None
                 
-                # ImageMagick command
-                subprocess.run(
-                    [
-                        "magick",
-                        str(source_path),
-                        "-strip",
-                        "-colorspace", "sRGB",
-                        "-quality", "95",
-                        "-interlace", "None",
-                        str(output_path)
-                    ],
-                    check=True,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+                _run_magick([(source_path, output_path)])
                 
                 logger.info(f"Converted WEBP → JPG via ImageMagick: {source_path.name}")
                 return output_path
@@ -277,12 +673,188 @@ def convert_to_jpeg(source_path: Path, output_dir: Path) -> Optional[Path]:
                 logger.error(
                     f"ImageMagick fallback failed for {source_path.name}: {fallback_error}"
                 )
+                if output_path is not None:
+                    _release_claimed_path(output_path)
                 return None
         
         logger.error(f"Error converting image {source_path.name} to JPEG: {error_msg}")
+        if output_path is not None:
+            _release_claimed_path(output_path)
         return None
 
 
+def _composite_over_white(img: Image.Image) -> Image.Image:
+    """
+    Flatten an RGBA image onto a white background in one vectorized pass.
+    
+    Integer-only NumPy blend: out = (rgb * a + 255 * (255 - a)) / 255, rounded,
+    the same result as pasting onto white with the alpha band as mask.
+    
+    Args:
+        img: RGBA image
+        
+    Returns:
+        RGB image
+    """
+    rgba = np.asarray(img)
+    alpha = rgba[..., 3:4].astype(np.uint16)
+    rgb = rgba[..., :3] * alpha  # Max 255 * 255, fits uint16
+    rgb += 255 * (255 - alpha) + 127
+    rgb //= 255
+    return Image.fromarray(rgb.astype(np.uint8))
+
+
+def _turbojpeg_save(pixels: np.ndarray, output_path: Path, subsample: int) -> bool:
+    """
+    Encode RGB pixels as a baseline JPEG (quality 95, no metadata) with TurboJPEG.
+    
+    Args:
+        pixels: Height x width x 3 uint8 RGB array
+        output_path: Destination path
+        subsample: TurboJPEG chroma subsampling constant
+        
+    Returns:
+        True if the JPEG was written, False if encoding failed (caller falls back to Pillow)
+    """
+    try:
+        data = _turbojpeg.encode(pixels, quality=95, pixel_format=TJPF_RGB, jpeg_subsample=subsample)
+    except Exception as e:
+        logger.debug(f"TurboJPEG encode failed, using Pillow: {output_path.name} ({e})")
+        return False
+    
+    with open(output_path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def _run_magick(pairs: List[Tuple[Path, Path]]) -> None:
+    """
+    Convert images to RealWare-compatible JPEGs with a single ImageMagick process.
+    
+    Each input is read, converted and written with -write, then dropped with
+    +delete, so N files cost one process start instead of N.
+    
+    Args:
+        pairs: List of (source_path, output_path)
+        
+    Raises:
+        subprocess.CalledProcessError: If ImageMagick fails on any file
+        OSError: If ImageMagick cannot be started
+    """
+    command = ["magick"]
+    for source_path, output_path in pairs:
+        command += [
+            str(source_path),
+            "-strip",
+            "-colorspace", "sRGB",
+            "-quality", "95",
+            "-interlace", "None",
+            "-write", str(output_path),
+            "+delete"
+        ]
+    # The last image is still needed as the command's final output; discard it to null:
+    command[-1] = "null:"
+    
+    subprocess.run(
+        command,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def _run_magick_batch(pairs: List[Tuple[Path, Path]], batch_size: int = 50) -> Dict[Path, Path]:
+    """
+    Run the ImageMagick WEBP fallback for many files with as few processes as possible.
+    
+    Files go through in batches (keeping the command line well under Windows'
+    length limit); if a batch fails, its files are retried one by one so a
+    single bad file does not fail the others.
+    
+    Args:
+        pairs: List of (source_path, output_path)
+        batch_size: Maximum number of files per ImageMagick process
+        
+    Returns:
+        Mapping of source_path to output_path for every file converted
+    """
+    converted = {}
+    for start in range(0, len(pairs), batch_size):
+        batch = pairs[start:start + batch_size]
+        try:
+            _run_magick(batch)
+            done = batch
+        except Exception:
+            done = []
+            for pair in batch:
+                try:
+                    _run_magick([pair])
+                    done.append(pair)
+                except Exception as fallback_error:
+                    logger.error(f"ImageMagick fallback failed for {pair[0].name}: {fallback_error}")
+                    _release_claimed_path(pair[1])
+        
+        for source_path, output_path in done:
+            logger.info(f"Converted WEBP → JPG via ImageMagick: {source_path.name}")
+            converted[source_path] = output_path
+    return converted
+
+
+def log_jpeg_codec() -> None:
+    """
+    Log which libjpeg build Pillow is using.
+    
+    JPEG decode/encode speed depends heavily on this: libjpeg-turbo (bundled with
+    the official Pillow wheels, and required by Pillow-SIMD) uses SIMD kernels,
+    plain libjpeg does not. Logged once at startup so a slow build is visible.
+    """
+    try:
+        jpeg_version = features.version("jpg")
+        if features.check_feature("libjpeg_turbo"):
+            logger.info(f"JPEG codec: libjpeg-turbo {jpeg_version}")
+        else:
+            logger.warning(f"JPEG codec: libjpeg {jpeg_version} (not libjpeg-turbo; JPEG conversion will be slower)")
+    except Exception as e:
+        logger.warning(f"Could not determine JPEG codec: {e}")
+
+
+def convert_folder_to_jpeg(
+    source_paths: List[Path],
+    output_dir: Path,
+    max_workers: Optional[int] = None
+) -> List[Optional[Path]]:
+    """
+    Convert a batch of images to JPEG in parallel.
+    
+    Runs convert_to_jpeg on a thread pool. Pillow releases the GIL while it
+    decodes and encodes, so conversions scale across cores. Output names are
+    claimed through the shared, locked directory cache, so concurrent
+    conversions never collide. WEBPs that need the ImageMagick fallback are
+    collected and converted together afterwards, in as few processes as possible.
+    
+    Args:
+        source_paths: Paths to source image files
+        output_dir: Directory to save converted JPEGs (processed folder)
+        max_workers: Maximum number of concurrent conversions (default: CPU count)
+        
+    Returns:
+        Full path to each converted JPEG (None if that conversion failed), in input order
+    """
+    if not source_paths:
+        return []
+    
+    magick_queue = []
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(source_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda path: convert_to_jpeg(path, output_dir, magick_queue), source_paths))
+    
+    if magick_queue:
+        converted = _run_magick_batch(magick_queue)
+        results = [converted.get(path, result) for path, result in zip(source_paths, results)]
+    
+    return results
+
+
 def ensure_output_dir(output_dir: str) -> Path:
     """
     Ensure output directory exists and is writable.
@@ -297,18 +869,25 @@ def ensure_output_dir(output_dir: str) -> Path:
         ValueError: If directory cannot be created or is not writable
     """
     path = Path(output_dir)
+    if path in _validated_dirs:
+        return path
     
     try:
         path.mkdir(parents=True, exist_ok=True)
         
-        # Test write permissions
+        # Test write permissions: os.access rejects the common case without touching
+        # the disk; the probe file stays authoritative since access() can report a
+        # network share as writable when it is not
         test_file = path / ".write_test"
         try:
+            if not os.access(path, os.W_OK):
+                raise PermissionError(f"No write access to {path}")
             test_file.touch()
             test_file.unlink()
         except Exception as e:
             raise ValueError(f"Output directory is not writable: {output_dir}") from e
         
+        _validated_dirs.add(path)
         return path
         
     except Exception as e:
@@ -1,7 +1,19 @@
 """Folder name parsing utilities."""
+import logging
 import re
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Patterns compiled once at import instead of on every call
+_PARCEL_PREFIX_RE = re.compile(r'(?:parcel|property)[\s\-_]*(\d+)', re.IGNORECASE)
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_DIGIT_RUN_RE = re.compile(r'\d{4,15}')
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+# Every ASCII byte except 0-9, for stripping non-digits with one bytes.translate call
+_ASCII_NON_DIGITS = bytes(b for b in range(128) if not chr(b).isdigit())
+
 
 def extract_parcel_number(folder_name: str) -> Optional[str]:
     """
@@ -20,47 +32,66 @@ def extract_parcel_number(folder_name: str) -> Optional[str]:
     Returns:
         Parcel number string or None if cannot extract
     """
+    # Checked once so the f-strings below are never built when DEBUG is off
+    debug = logger.isEnabledFor(logging.DEBUG)
+    
     if not folder_name:
-        print(f"DEBUG folder_parser: Empty folder name")
+        if debug:
+            logger.debug("Empty folder name")
         return None
     
     # Strip whitespace
     folder_name = folder_name.strip()
-    print(f"DEBUG folder_parser: Processing folder name: '{folder_name}'")
+    if debug:
+        logger.debug(f"Processing folder name: '{folder_name}'")
+    
+    # Fast path: the folder name IS the parcel number (what Pattern 2 would return)
+    if folder_name.isdecimal() and 4 <= len(folder_name) <= 15:
+        if debug:
+            logger.debug(f"Numeric folder name: '{folder_name}'")
+        return folder_name
     
     # Try to extract numbers from common patterns
     # Pattern 1: "Parcel-12345" or "Parcel 12345"
-    match = re.search(r'(?:parcel|property)[\s\-_]*(\d+)', folder_name, re.IGNORECASE)
+    match = _PARCEL_PREFIX_RE.search(folder_name)
     if match:
         result = match.group(1)
-        print(f"DEBUG folder_parser: Pattern 1 match: '{result}'")
+        if debug:
+            logger.debug(f"Pattern 1 match: '{result}'")
         return result
     
     # Pattern 2: Just numbers (if folder name is mostly numbers)
     # Check if folder name is primarily numeric
-    numbers_only = re.sub(r'[^\d]', '', folder_name)
+    if folder_name.isascii():
+        numbers_only = folder_name.encode('ascii').translate(None, _ASCII_NON_DIGITS).decode('ascii')
+    else:
+        numbers_only = _NON_DIGIT_RE.sub('', folder_name)
     if len(numbers_only) >= 4 and len(numbers_only) <= 15:
         # If folder name is mostly numbers, use it
         if len(numbers_only) / len(folder_name.replace(' ', '')) > 0.5:
-            print(f"DEBUG folder_parser: Pattern 2 match (mostly numbers): '{numbers_only}'")
+            if debug:
+                logger.debug(f"Pattern 2 match (mostly numbers): '{numbers_only}'")
             return numbers_only
     
     # Pattern 3: Extract any sequence of 4-15 digits
-    match = re.search(r'\d{4,15}', folder_name)
+    match = _DIGIT_RUN_RE.search(folder_name)
     if match:
         result = match.group(0)
-        print(f"DEBUG folder_parser: Pattern 3 match: '{result}'")
+        if debug:
+            logger.debug(f"Pattern 3 match: '{result}'")
         return result
     
     # Pattern 4: If folder name itself looks like a parcel number
     # (mostly alphanumeric, reasonable length)
-    cleaned = re.sub(r'[^\w]', '', folder_name)
+    cleaned = _NON_WORD_RE.sub('', folder_name)
     if len(cleaned) >= 4 and len(cleaned) <= 15 and cleaned.isalnum():
         # Check if it's mostly numeric
         if sum(c.isdigit() for c in cleaned) >= len(cleaned) * 0.7:
-            print(f"DEBUG folder_parser: Pattern 4 match: '{cleaned}'")
+            if debug:
+                logger.debug(f"Pattern 4 match: '{cleaned}'")
             return cleaned
     
-    print(f"DEBUG folder_parser: No match found for '{folder_name}'")
+    if debug:
+        logger.debug(f"No match found for '{folder_name}'")
     return None
 
@@ -3,12 +3,22 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 from pathlib import Path
 import logging
+import logging.handlers
+import queue
 import threading
+from typing import Optional
 
 
 class MLSPhotoProcessorGUI:
     """Desktop GUI application for processing MLS photos."""
     
+    # How often the Tk main loop moves queued log records into the text area
+    LOG_DRAIN_INTERVAL_MS = 50
+    # Most records moved per drain tick, so a log burst never stalls the event loop
+    LOG_DRAIN_BATCH = 256
+    # Oldest lines are dropped beyond this, so the text area (and each insert) stays bounded
+    LOG_MAX_LINES = 2000
+    
     def __init__(self, processor_func, parcel_matcher, classifier):
         """
         Initialize GUI.
@@ -102,31 +112,67 @@ class MLSPhotoProcessorGUI:
         self.log_text.pack(fill=tk.BOTH, expand=True)
     
     def _setup_logging(self):
-        """Set up logging to GUI text area."""
-        class GUILogHandler(logging.Handler):
-            def __init__(self, text_widget):
-                super().__init__()
-                self.text_widget = text_widget
-            
-            def emit(self, record):
-                msg = self.format(record)
-                self.text_widget.config(state=tk.NORMAL)
-                self.text_widget.insert(tk.END, msg + "\n")
-                self.text_widget.see(tk.END)
-                self.text_widget.config(state=tk.DISABLED)
-        
-        gui_handler = GUILogHandler(self.log_text)
-        gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        """
+        Set up logging to GUI text area.
+        
+        Records from any thread are only put on a queue; the Tk main loop drains it,
+        so worker threads never touch the (non-thread-safe) Text widget or wait on it.
+        """
+        self._log_queue = queue.Queue()
+        self._log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         logger = logging.getLogger()
-        logger.addHandler(gui_handler)
+        logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        self.root.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
     
-    def _log(self, message: str, level: str = "INFO"):
-        """Log message to GUI."""
+    def _drain_log_queue(self):
+        """Append a batch of queued log records to the text area, then reschedule."""
+        count = self._write_queued_logs(self.LOG_DRAIN_BATCH)
+        
+        # Come straight back if the batch limit left records behind
+        delay = 0 if count == self.LOG_DRAIN_BATCH else self.LOG_DRAIN_INTERVAL_MS
+        self.root.after(delay, self._drain_log_queue)
+    
+    def _write_queued_logs(self, limit: Optional[int] = None) -> int:
+        """
+        Append queued log records to the text area in one insert.
+        
+        Args:
+            limit: Maximum number of records to take, or None to empty the queue
+            
+        Returns:
+            Number of records appended
+        """
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                record = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            messages.append(self._log_formatter.format(record))
+        
+        if messages:
+            self._append_log_text("\n".join(messages) + "\n")
+        return len(messages)
+    
+    def _append_log_text(self, text: str):
+        """Append text to the log area, trimming the oldest lines past LOG_MAX_LINES."""
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
+        self.log_text.insert(tk.END, text)
+        
+        # 'end-1c' is on the empty line after the final newline, hence the -1
+        line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        excess = line_count - self.LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+        
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
-        self.root.update_idletasks()
+    
+    def _log(self, message: str, level: str = "INFO"):
+        """Log message to GUI."""
+        # Write out records still queued from worker threads first so lines stay in order
+        self._write_queued_logs()
+        self._append_log_text(f"{message}\n")
     
     def _select_folder(self):
         """Open folder selection dialog."""
@@ -194,8 +240,14 @@ class MLSPhotoProcessorGUI:
         thread = threading.Thread(target=process_thread, daemon=True)
         thread.start()
     
+    def _flush_log_handlers(self):
+        """Flush buffered log handlers so a finished run is fully on disk."""
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+    
     def _processing_complete(self, result: dict):
         """Handle processing completion."""
+        self._flush_log_handlers()
         self.process_btn.config(
             state=tk.NORMAL,
             text="Process Images",
@@ -232,6 +284,7 @@ class MLSPhotoProcessorGUI:
     
     def _processing_error(self, error_msg: str):
         """Handle processing error."""
+        self._flush_log_handlers()
         self.process_btn.config(
             state=tk.NORMAL,
             text="Process Images",
@@ -5,6 +5,9 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# SOI marker followed by the 0xFF that starts the next marker
+JPEG_SIGNATURE = b'\xff\xd8\xff'
+
 
 def validate_image_file(file_path: Path) -> bool:
     """
@@ -23,31 +26,34 @@ def validate_image_file(file_path: Path) -> bool:
             logger.debug(f"File {file_path.name} has invalid extension: {ext}")
             return False
         
-        # Check if file exists
-        if not file_path.exists():
-            logger.debug(f"File {file_path.name} does not exist")
-            return False
-        
-        # Try to open with PIL
+        # Sniff the signature: every JPEG starts with SOI + the first marker's 0xFF,
+        # so misnamed files are rejected after reading 3 bytes instead of being parsed
         try:
-            with Image.open(file_path) as img:
-                # Verify it's actually an image
-                img.verify()
-            
-            # Reopen for format check (verify() closes the image)
-            with Image.open(file_path) as img:
-                # Check if it's JPEG format
-                if img.format not in ['JPEG', 'JPG']:
-                    logger.debug(f"File {file_path.name} is not JPEG format: {img.format}")
+            with open(file_path, 'rb') as f:
+                signature = f.read(3)
+                if signature != JPEG_SIGNATURE:
+                    logger.debug(f"File {file_path.name} is not JPEG format (signature {signature.hex()})")
                     return False
                 
-                # Check if it's RGB or grayscale (valid JPEG modes)
-                if img.mode not in ['RGB', 'L', 'CMYK']:
-                    logger.debug(f"File {file_path.name} has unsupported mode: {img.mode}")
-                    return False
-                
-                return True
+                # Header-only open of the same handle: Pillow fills format and mode
+                # from the markers up to SOF without decoding any pixel data
+                f.seek(0)
+                with Image.open(f) as img:
+                    # Check if it's JPEG format
+                    if img.format not in ['JPEG', 'JPG']:
+                        logger.debug(f"File {file_path.name} is not JPEG format: {img.format}")
+                        return False
+                    
+                    # Check if it's RGB or grayscale (valid JPEG modes)
+                    if img.mode not in ['RGB', 'L', 'CMYK']:
+                        logger.debug(f"File {file_path.name} has unsupported mode: {img.mode}")
+                        return False
+                    
+                    return True
                 
+        except FileNotFoundError:
+            logger.debug(f"File {file_path.name} does not exist")
+            return False
         except Exception as e:
             logger.debug(f"File {file_path.name} cannot be opened as image: {e}")
             return False
@@ -1,13 +1,79 @@
 """CSV loader and parcel number matching module."""
+import csv
+import logging
 import os
-import pandas as pd
+import pickle
+from functools import lru_cache
+from itertools import islice
 from typing import Optional, Dict
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Optional: PyArrow's multi-threaded native CSV reader for large parcel files
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# str.translate table deleting the separators ignored when matching parcel numbers
+_SEPARATOR_DELETE_TABLE = str.maketrans('', '', '-_ ')
+
+
+@lru_cache(maxsize=1)
+def _resolve_csv_path() -> str:
+    """
+    Pick the default CSV (see ParcelMatcher priority order).
+    
+    Resolved once per process; later ParcelMatcher instances skip the exists() checks.
+    
+    Returns:
+        Path of the CSV to load
+    """
+    # Check Downloads location first (primary source)
+    downloads_path = Path.home() / "Downloads" / "Accounts and Parcel Numbers - Sheet1.csv"
+    # Check override location second
+    override_path = Path.home() / "Documents" / "MLS_Photo_Processor" / "Accounts_and_Parcel_Numbers.csv"
+    bundled_path = Path(__file__).parent / "data" / "Accounts_and_Parcel_Numbers.csv"
+    
+    if downloads_path.exists():
+        csv_path = str(downloads_path)
+        print(f"Using Downloads CSV: {csv_path}")
+    elif override_path.exists():
+        csv_path = str(override_path)
+        print(f"Using override CSV: {csv_path}")
+    elif bundled_path.exists():
+        csv_path = str(bundled_path)
+        print(f"Using bundled CSV: {csv_path}")
+    else:
+        # Create override directory and use bundled as fallback
+        override_path.parent.mkdir(parents=True, exist_ok=True)
+        csv_path = str(bundled_path)
+        print(f"Using bundled CSV (no other CSV found): {csv_path}")
+    
+    return csv_path
+
+
+@lru_cache(maxsize=8192)
+def _normalize_parcel(parcel_no: str) -> str:
+    """Memoized body of ParcelMatcher.normalize_parcel_number (repeat lookups become a dict hit)."""
+    # Strip whitespace, uppercase, and remove common separators in one translate pass
+    return parcel_no.strip().upper().translate(_SEPARATOR_DELETE_TABLE)
+
 
 class ParcelMatcher:
     """Handles CSV loading and parcel number to account number matching."""
     
+    # CSVs larger than this are parsed with PyArrow when it is installed
+    PYARROW_MIN_BYTES = 5 * 1024 * 1024
+    
+    # Parsed maps are cached here, keyed by the CSV's path, mtime and size
+    PARCEL_CACHE_PATH = Path.home() / ".cache" / "mls_photo_processor" / "parcel_map.pkl"
+    # Bump when parsing/normalization changes so old caches are rebuilt
+    PARCEL_CACHE_VERSION = 1
+    
     def __init__(self, csv_path: str = None):
         """Initialize matcher and load CSV.
         
@@ -18,29 +84,11 @@ class ParcelMatcher:
         """
         # Determine CSV path
         if csv_path is None:
-            # Check Downloads location first (primary source)
-            downloads_path = Path.home() / "Downloads" / "Accounts and Parcel Numbers - Sheet1.csv"
-            # Check override location second
-            override_path = Path.home() / "Documents" / "MLS_Photo_Processor" / "Accounts_and_Parcel_Numbers.csv"
-            bundled_path = Path(__file__).parent / "data" / "Accounts_and_Parcel_Numbers.csv"
-            
-            if downloads_path.exists():
-                csv_path = str(downloads_path)
-                print(f"Using Downloads CSV: {csv_path}")
-            elif override_path.exists():
-                csv_path = str(override_path)
-                print(f"Using override CSV: {csv_path}")
-            elif bundled_path.exists():
-                csv_path = str(bundled_path)
-                print(f"Using bundled CSV: {csv_path}")
-            else:
-                # Create override directory and use bundled as fallback
-                override_path.parent.mkdir(parents=True, exist_ok=True)
-                csv_path = str(bundled_path)
-                print(f"Using bundled CSV (no other CSV found): {csv_path}")
+            csv_path = _resolve_csv_path()
         
         self.csv_path = csv_path
         self.parcel_map: Dict[str, str] = {}  # parcel_no -> account_no
+        self.parcel_map_stripped: Dict[str, str] = {}  # parcel_no without leading zeros -> first matching parcel_map key
         self.load_csv()
     
     def normalize_parcel_number(self, parcel_no: str) -> str:
@@ -61,13 +109,7 @@ class ParcelMatcher:
         if not parcel_no:
             return ""
         
-        # Strip whitespace and uppercase
-        normalized = str(parcel_no).strip().upper()
-        
-        # Remove common separators
-        normalized = normalized.replace('-', '').replace('_', '').replace(' ', '')
-        
-        return normalized
+        return _normalize_parcel(str(parcel_no))
     
     def load_csv(self):
         """Load CSV file and build parcel number to account number mapping."""
@@ -75,54 +117,142 @@ class ParcelMatcher:
             if not os.path.exists(self.csv_path):
                 raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
             
-            # Read CSV - IMPORTANT: Read PARCELNO as string to preserve full numbers
-            df = pd.read_csv(self.csv_path, dtype={'PARCELNO': str, 'ACCOUNTNO': str})
+            # Skip parsing entirely if this exact file was already parsed on an earlier run
+            stat = os.stat(self.csv_path)
+            cache_key = (os.path.abspath(self.csv_path), stat.st_mtime_ns, stat.st_size, self.PARCEL_CACHE_VERSION)
+            if self._load_cached_maps(cache_key):
+                print(f"Loaded {len(self.parcel_map)} parcel numbers from cache")
+                return
             
-            # Validate required columns
-            required_cols = ['ACCOUNTNO', 'PARCELNO']
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            if missing_cols:
-                raise ValueError(f"Missing required columns: {missing_cols}. Found columns: {list(df.columns)}")
-            
-            # Build parcel number to account number mapping
-            for _, row in df.iterrows():
-                account_no = str(row['ACCOUNTNO']).strip()
-                parcel_no = str(row['PARCELNO']).strip()
-                
-                # Handle NaN values (check for both string 'nan' and pandas NaN)
-                if not parcel_no or parcel_no.lower() == 'nan' or parcel_no == '' or pd.isna(row['PARCELNO']):
-                    continue
-                if not account_no or account_no.lower() == 'nan' or account_no == '' or pd.isna(row['ACCOUNTNO']):
-                    continue
+            # Read CSV with the stdlib reader - every field stays a string, preserving full numbers
+            # (utf-8-sig drops the byte order mark spreadsheet exports often start with)
+            with open(self.csv_path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
                 
-                # Convert float scientific notation back to full number if needed
-                # (in case pandas still converted it)
-                try:
-                    # If it looks like scientific notation, convert it
-                    if 'e+' in parcel_no.lower() or 'e-' in parcel_no.lower():
-                        parcel_no = f"{float(parcel_no):.0f}"
-                    # If it's a float string like "317703000043.0", remove the .0
-                    elif parcel_no.endswith('.0'):
-                        parcel_no = parcel_no[:-2]
-                except (ValueError, AttributeError):
-                    pass  # Keep as-is if conversion fails
+                # Validate required columns
+                columns = reader.fieldnames or []
+                required_cols = ['ACCOUNTNO', 'PARCELNO']
+                missing_cols = [col for col in required_cols if col not in columns]
+                if missing_cols:
+                    raise ValueError(f"Missing required columns: {missing_cols}. Found columns: {list(columns)}")
                 
-                # Normalize parcel number
-                normalized_parcel = self.normalize_parcel_number(parcel_no)
+                # Build parcel number to account number mapping
+                if PYARROW_AVAILABLE and os.path.getsize(self.csv_path) > self.PYARROW_MIN_BYTES:
+                    rows = self._read_columns_pyarrow()
+                else:
+                    rows = ((row.get('PARCELNO'), row.get('ACCOUNTNO')) for row in reader)
                 
-                if normalized_parcel:
-                    self.parcel_map[normalized_parcel] = account_no
+                for parcel_no, account_no in rows:
+                    self._add_row(parcel_no or '', account_no or '')
             
+            self._save_cached_maps(cache_key)
             print(f"Loaded {len(self.parcel_map)} parcel numbers from CSV")
-            # Debug: Show first few entries
-            print(f"DEBUG: Sample entries from CSV (first 5):")
-            for i, (parcel, account) in enumerate(list(self.parcel_map.items())[:5]):
-                print(f"DEBUG:   '{parcel}' -> {account}")
+            # Debug: Show first few entries (once per load, not on every failed lookup)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sample entries from CSV (first 5):")
+                for parcel, account in islice(self.parcel_map.items(), 5):
+                    logger.debug(f"  '{parcel}' -> {account}")
             
         except Exception as e:
             print(f"Error loading CSV: {e}")
             raise
     
+    def _load_cached_maps(self, cache_key: tuple) -> bool:
+        """
+        Restore parcel_map/parcel_map_stripped from the on-disk cache.
+        
+        Args:
+            cache_key: (path, mtime_ns, size, cache version) of the CSV being loaded
+            
+        Returns:
+            True if the cache matched and was loaded, False otherwise
+        """
+        try:
+            with open(self.PARCEL_CACHE_PATH, 'rb') as f:
+                cached_key, parcel_map, parcel_map_stripped = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parcel map cache {self.PARCEL_CACHE_PATH}: {e}")
+            return False
+        
+        if cached_key != cache_key:
+            return False
+        
+        self.parcel_map = parcel_map
+        self.parcel_map_stripped = parcel_map_stripped
+        return True
+    
+    def _save_cached_maps(self, cache_key: tuple):
+        """
+        Save parcel_map/parcel_map_stripped to the on-disk cache (best effort).
+        
+        Args:
+            cache_key: (path, mtime_ns, size, cache version) of the CSV just parsed
+        """
+        try:
+            self.PARCEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so a crash never leaves a truncated cache behind
+            tmp_path = self.PARCEL_CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((cache_key, self.parcel_map, self.parcel_map_stripped), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.PARCEL_CACHE_PATH)
+        except Exception as e:
+            logger.warning(f"Could not save parcel map cache: {e}")
+    
+    def _read_columns_pyarrow(self):
+        """
+        Parse the PARCELNO and ACCOUNTNO columns with PyArrow's native CSV reader.
+        
+        Returns:
+            Iterator of (parcel_no, account_no) string pairs
+        """
+        table = pa_csv.read_csv(
+            self.csv_path,
+            convert_options=pa_csv.ConvertOptions(
+                # Read as strings to preserve full numbers, and skip every other column
+                column_types={'PARCELNO': pa.string(), 'ACCOUNTNO': pa.string()},
+                include_columns=['PARCELNO', 'ACCOUNTNO'],
+            ),
+        )
+        return zip(table['PARCELNO'].to_pylist(), table['ACCOUNTNO'].to_pylist())
+    
+    def _add_row(self, parcel_no: str, account_no: str):
+        """
+        Add one CSV row to the parcel map, skipping rows with a blank field.
+        
+        Args:
+            parcel_no: Raw PARCELNO value
+            account_no: Raw ACCOUNTNO value
+        """
+        account_no = account_no.strip()
+        parcel_no = parcel_no.strip()
+        
+        # Skip empty values (and literal 'nan' left by spreadsheet exports)
+        if not parcel_no or parcel_no.lower() == 'nan':
+            return
+        if not account_no or account_no.lower() == 'nan':
+            return
+        
+        # Convert float scientific notation back to full number if needed
+        # (in case the spreadsheet export converted it)
+        try:
+            # If it looks like scientific notation, convert it
+            if 'e+' in parcel_no.lower() or 'e-' in parcel_no.lower():
+                parcel_no = f"{float(parcel_no):.0f}"
+            # If it's a float string like "317703000043.0", remove the .0
+            elif parcel_no.endswith('.0'):
+                parcel_no = parcel_no[:-2]
+        except (ValueError, AttributeError):
+            pass  # Keep as-is if conversion fails
+        
+        # Normalize parcel number
+        normalized_parcel = self.normalize_parcel_number(parcel_no)
+        
+        if normalized_parcel:
+            self.parcel_map[normalized_parcel] = account_no
+            self.parcel_map_stripped.setdefault(normalized_parcel.lstrip('0'), normalized_parcel)
+    
     def match_parcel_number(self, parcel_no: str) -> Optional[str]:
         """
         Match a parcel number to an account number.
@@ -133,41 +263,47 @@ class ParcelMatcher:
         Returns:
             Account number if found, None otherwise
         """
+        # Checked once so the f-strings below are never built when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
         if not parcel_no:
-            print(f"DEBUG: Empty parcel number provided")
+            if debug:
+                logger.debug("Empty parcel number provided")
             return None
         
         # Normalize the input parcel number
         normalized = self.normalize_parcel_number(parcel_no)
-        print(f"DEBUG: Input parcel: '{parcel_no}' -> normalized: '{normalized}'")
+        if debug:
+            logger.debug(f"Input parcel: '{parcel_no}' -> normalized: '{normalized}'")
         
         if not normalized:
-            print(f"DEBUG: Normalized parcel is empty")
+            if debug:
+                logger.debug("Normalized parcel is empty")
             return None
         
         # Try exact match
         if normalized in self.parcel_map:
-            print(f"DEBUG: Exact match found: '{normalized}' -> {self.parcel_map[normalized]}")
+            if debug:
+                logger.debug(f"Exact match found: '{normalized}' -> {self.parcel_map[normalized]}")
             return self.parcel_map[normalized]
         
         # Try without leading zeros (in case CSV has them but folder doesn't)
         normalized_no_zeros = normalized.lstrip('0')
         if normalized_no_zeros and normalized_no_zeros in self.parcel_map:
-            print(f"DEBUG: Match found (no leading zeros): '{normalized_no_zeros}' -> {self.parcel_map[normalized_no_zeros]}")
+            if debug:
+                logger.debug(f"Match found (no leading zeros): '{normalized_no_zeros}' -> {self.parcel_map[normalized_no_zeros]}")
             return self.parcel_map[normalized_no_zeros]
         
         # Try with leading zeros (in case folder has them but CSV doesn't)
-        for stored_parcel, account_no in self.parcel_map.items():
-            stored_no_zeros = stored_parcel.lstrip('0')
-            if stored_no_zeros == normalized_no_zeros or stored_parcel == normalized:
-                print(f"DEBUG: Match found (reverse check): '{stored_parcel}' -> {account_no}")
-                return account_no
-        
-        # Debug: Show sample of what's in the map
-        print(f"DEBUG: No match found. Sample entries in map (first 5):")
-        for i, (key, val) in enumerate(list(self.parcel_map.items())[:5]):
-            print(f"DEBUG:   '{key}' -> {val}")
+        stored_parcel = self.parcel_map_stripped.get(normalized_no_zeros)
+        if stored_parcel is not None:
+            account_no = self.parcel_map[stored_parcel]
+            if debug:
+                logger.debug(f"Match found (reverse check): '{stored_parcel}' -> {account_no}")
+            return account_no
         
+        if debug:
+            logger.debug(f"No match found for normalized parcel: '{normalized}'")
         return None
 
 
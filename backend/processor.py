@@ -1,23 +1,34 @@
 """Main image processing workflow."""
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
+from collections import Counter
 
 from folder_parser import extract_parcel_number
 from matcher import ParcelMatcher
 from image_validator import validate_image_file
-from classifier import ImageClassifier
-from file_utils import generate_filename, copy_and_rename_image, rename_pdf, convert_to_jpeg
+from file_utils import generate_filename, copy_and_rename_images, rename_pdf, convert_folder_to_jpeg, forget_dir_listings
+
+if TYPE_CHECKING:
+    # Type hint only: importing classifier pulls in torch/transformers, which the
+    # caller has already paid for when it built the ImageClassifier it passes in
+    from classifier import ImageClassifier
 
 logger = logging.getLogger(__name__)
 
+# Lowercase image extensions, as tuples for a single str.endswith() check per file
+JPEG_SUFFIXES = ('.jpg', '.jpeg')
+CONVERT_SUFFIXES = ('.png', '.gif', '.bmp', '.tiff', '.webp', '.jfif')
+
 
 def process_folder(
     folder_path: str,
     output_dir: str,
     parcel_matcher: ParcelMatcher,
-    classifier: ImageClassifier
+    classifier: "ImageClassifier"
 ) -> Dict:
     """
     Process images in selected folder.
@@ -50,6 +61,28 @@ def process_folder(
     folder = Path(folder_path)
     output = Path(output_dir)
     
+    # Empty folder: nothing to match, convert or classify
+    with os.scandir(folder) as entries:
+        if next(entries, None) is None:
+            logger.warning(f"Folder is empty: {folder}")
+            return {
+                "account_no": "UNKNOWN",
+                "parcel_no": None,
+                "processed_count": 0,
+                "errors": ["No image files found in folder"],
+                "skipped_files": [],
+                "results": []
+            }
+    
+    # Make sure CLIP is loading while the folder is scanned, converted and validated.
+    # warmup() returns at once when the model is already resident (e.g. from the GUI's
+    # startup warmup or an earlier folder), so repeat calls cost nothing.
+    if not classifier.is_loaded:
+        threading.Thread(target=classifier.warmup, daemon=True).start()
+    
+    # Re-list output directories for this run, in case files changed outside the app
+    forget_dir_listings()
+    
     errors = []
     skipped_files = []
     results = []
@@ -60,10 +93,8 @@ def process_folder(
     
     if parcel_no:
         logger.info(f"Extracted parcel number: '{parcel_no}'")
-        print(f"DEBUG: Extracted parcel number from '{folder.name}': '{parcel_no}'")
     else:
         logger.warning(f"Could not extract parcel number from folder name: '{folder.name}'")
-        print(f"DEBUG: Failed to extract parcel number from folder name: '{folder.name}'")
         errors.append(f"Could not extract parcel number from folder name")
     
     # Step 2: Match parcel number to account number
@@ -79,9 +110,30 @@ def process_folder(
     else:
         errors.append("Cannot match account number: no parcel number extracted")
     
+    # List the folder once: DirEntry caches the file type, so this is one pass
+    # with no per-entry stat, shared by the PDF and image steps below
+    logger.info(f"Scanning folder for image files: {folder}")
+    pdf_files = []
+    image_files = []
+    files_to_convert = []
+    
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            
+            name_lower = entry.name.lower()
+            
+            if name_lower.endswith('.pdf'):
+                pdf_files.append(Path(entry.path))
+            # If already JPEG, use original file
+            elif name_lower.endswith(JPEG_SUFFIXES):
+                image_files.append(Path(entry.path))
+            elif name_lower.endswith(CONVERT_SUFFIXES):
+                files_to_convert.append(Path(entry.path))
+    
     # Step 2.5: Handle PDF files - rename them with account number
     logger.info("Processing PDF files...")
-    pdf_files = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() == '.pdf']
     for pdf_file in pdf_files:
         if account_no != "UNKNOWN":
             renamed_pdf = rename_pdf(pdf_file, account_no, output)
@@ -92,36 +144,17 @@ def process_folder(
         else:
             logger.warning(f"Skipping PDF rename (no account number): {pdf_file.name}")
     
-    # Step 3: Scan folder for image files and convert non-JPEG images to processed folder
-    logger.info(f"Scanning folder for image files: {folder}")
-    image_extensions = ['.jpg', '.jpeg', '.JPG', '.JPEG', '.png', '.PNG', '.gif', '.GIF', '.bmp', '.BMP', '.tiff', '.TIFF', '.webp', '.WEBP', '.jfif', '.JFIF']
-    jpeg_extensions = ['.jpg', '.jpeg', '.JPG', '.JPEG']
-    image_files = []
+    # Step 3: Convert non-JPEG images (found by the scan above) to processed folder
     converted_count = 0
     
-    # Process each image file
-    for file_path in folder.iterdir():
-        if not file_path.is_file():
-            continue
-            
-        suffix_lower = file_path.suffix.lower()
-        
-        # Skip if not an image file
-        if suffix_lower not in image_extensions:
-            continue
-        
-        # If already JPEG, use original file
-        if suffix_lower in jpeg_extensions:
-            image_files.append(file_path)
+    # Convert non-JPEG images to JPEG and save to processed folder (in parallel)
+    for file_path, converted_path in zip(files_to_convert, convert_folder_to_jpeg(files_to_convert, output)):
+        if converted_path:
+            image_files.append(converted_path)
+            converted_count += 1
         else:
-            # Convert non-JPEG images to JPEG and save to processed folder
-            converted_path = convert_to_jpeg(file_path, output)
-            if converted_path:
-                image_files.append(converted_path)
-                converted_count += 1
-            else:
-                errors.append(f"Failed to convert image: {file_path.name}")
-                skipped_files.append(str(file_path.name))
+            errors.append(f"Failed to convert image: {file_path.name}")
+            skipped_files.append(str(file_path.name))
     
     logger.info(f"Found {len(image_files)} JPEG image files ({converted_count} converted from other formats)")
     
@@ -136,12 +169,15 @@ def process_folder(
             "results": results
         }
     
-    # Step 4: Validate images
+    # Step 4: Validate images (in parallel - Pillow releases the GIL while parsing)
     logger.info("Validating image files...")
     valid_images = []
     
-    for image_file in image_files:
-        if validate_image_file(image_file):
+    with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4, len(image_files))) as executor:
+        validity = list(executor.map(validate_image_file, image_files))
+    
+    for image_file, is_valid in zip(image_files, validity):
+        if is_valid:
             valid_images.append(image_file)
         else:
             skipped_files.append(str(image_file.name))
@@ -161,44 +197,48 @@ def process_folder(
         }
     
     # Step 5: Classify images
+    # Paths are sorted once here; every later step keeps this order, so each
+    # classification group comes out ordered by original filename without re-sorting
     logger.info("Classifying images...")
+    valid_images.sort(key=str)
     image_paths = [str(img) for img in valid_images]
     classifications = classifier.classify_images(image_paths)
     
-    # Step 6: Group by classification and generate sequential numbers
-    logger.info("Grouping images by classification...")
-    classification_groups = defaultdict(list)
-    
-    for image_path, classification in classifications:
-        classification_groups[classification].append(image_path)
-    
-    # Step 7: Generate filenames and copy files
-    logger.info("Generating filenames and copying files...")
+    # Step 6: Generate sequential numbers per classification and filenames
+    # Images are already in filename order (Step 5), so a running count per label gives
+    # each image its number in one pass - no grouping or sorting by label needed
+    logger.info("Generating filenames...")
+    label_counts = Counter()
+    copy_jobs = []
+    copy_classifications = []
+    
+    # Results come back in input order: pair labels with the Path objects we already
+    # have rather than re-parsing the path strings into new Paths
+    for image_file, (_, classification) in zip(valid_images, classifications):
+        label_counts[classification] += 1
+        filename = generate_filename(account_no, classification, label_counts[classification])
+        copy_jobs.append((image_file, filename))
+        copy_classifications.append(classification)
+    
+    # Step 7: Copy files
+    logger.info("Copying files...")
     processed_count = 0
     
-    for classification, image_list in classification_groups.items():
-        # Sort images by original filename for consistent ordering
-        image_list.sort()
-        
-        for index, image_path in enumerate(image_list, start=1):
-            # Generate filename
-            filename = generate_filename(account_no, classification, index)
-            
-            # Copy and rename
-            source_path = Path(image_path)
-            copied_path = copy_and_rename_image(source_path, output, filename)
-            
-            if copied_path:
-                processed_count += 1
-                results.append({
-                    "original_file": str(source_path.name),
-                    "new_filename": filename,
-                    "classification": classification,
-                    "saved_path": str(copied_path)
-                })
-                logger.info(f"Processed: {source_path.name} -> {filename}")
-            else:
-                errors.append(f"Failed to copy: {source_path.name}")
+    # Copy and rename (copies overlap on a thread pool)
+    copied_paths = copy_and_rename_images(copy_jobs, output)
+    
+    for (source_path, filename), classification, copied_path in zip(copy_jobs, copy_classifications, copied_paths):
+        if copied_path:
+            processed_count += 1
+            results.append({
+                "original_file": str(source_path.name),
+                "new_filename": filename,
+                "classification": classification,
+                "saved_path": str(copied_path)
+            })
+            logger.info(f"Processed: {source_path.name} -> {filename}")
+        else:
+            errors.append(f"Failed to copy: {source_path.name}")
     
     logger.info(f"Processing complete: {processed_count} images processed")
     
@@ -13,7 +13,6 @@ a = Analysis(
         'transformers',
         'torch',
         'PIL',
-        'pandas',
         'numpy',
         'tkinter',
     ],
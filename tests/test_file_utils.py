@@ -0,0 +1,37 @@
+"""Tests for file_utils image conversion."""
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+# Backend modules import each other by bare name, as when run from backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+
+@pytest.fixture
+def file_utils_without_turbojpeg(monkeypatch):
+    """Import file_utils as if PyTurboJPEG were not installed."""
+    monkeypatch.setitem(sys.modules, "turbojpeg", None)
+    monkeypatch.delitem(sys.modules, "file_utils", raising=False)
+    module = importlib.import_module("file_utils")
+    yield module
+    sys.modules.pop("file_utils", None)
+
+
+def test_convert_png_without_turbojpeg(file_utils_without_turbojpeg, tmp_path):
+    source = tmp_path / "photo.png"
+    Image.new("RGB", (16, 16), (200, 30, 30)).save(source)
+    output_dir = tmp_path / "processed"
+
+    assert file_utils_without_turbojpeg._turbojpeg is None
+    output_path = file_utils_without_turbojpeg.convert_to_jpeg(source, output_dir)
+
+    assert output_path == output_dir / "photo.JPG"
+    with Image.open(output_path) as img:
+        assert img.format == "JPEG"
+        assert img.mode == "RGB"
+        assert img.size == (16, 16)